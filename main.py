@@ -179,6 +179,8 @@ def setup_observability() -> ObservabilityContext:
         service_name=service_name,
         otel_endpoint=otel_endpoint,
         otel_insecure=otel_insecure,
+        background_emit=os.environ.get("LOG_BACKGROUND_EMIT", "false").lower() == "true",
+        capture_stack_trace=os.environ.get("LOG_STACK_TRACE", "true").lower() == "true",
     )
 
     initialize_observability(handler=otel_handler, config=obs_config)
@@ -41,7 +41,9 @@ from .config import (
     ObservabilityConfig,
     get_config,
     get_console_output,
+    get_dispatcher,
     get_handler,
+    has_log_sinks,
     initialize_observability,
     is_initialized,
     shutdown,
@@ -49,6 +51,7 @@ from .config import (
 from .context import (
     ObservabilityContext,
     ObservabilitySpan,
+    create_span_context,
     get_or_create_context,
     reset_context,
     set_context,
@@ -61,6 +64,7 @@ from .decorators import (
     traced_memory_operation,
     traced_tool,
 )
+from .dispatcher import BackgroundDispatcher
 from .emitters import (
     emit_component_end,
     emit_component_error,
@@ -70,6 +74,7 @@ from .emitters import (
     emit_info,
     emit_log,
     emit_warning,
+    snapshot_input,
 )
 from .handlers import (
     CompositeHandler,
@@ -91,6 +96,8 @@ from .tracer import (
 )
 
 __all__ = [
+    # Dispatch
+    "BackgroundDispatcher",
     "ComponentType",
     "CompositeHandler",
     "ConsoleOutput",
@@ -110,6 +117,7 @@ __all__ = [
     "ObservabilityContext",
     "ObservabilitySpan",
     "TraceEvent",
+    "create_span_context",
     "emit_component_end",
     "emit_component_error",
     "emit_component_start",
@@ -125,9 +133,11 @@ __all__ = [
     "get_config",
     "get_console_output",
     "get_current_span",
+    "get_dispatcher",
     "get_handler",
     "get_or_create_context",
     "get_tracer",
+    "has_log_sinks",
     # Tracer
     "init_tracer",
     "initialize_observability",
@@ -138,6 +148,7 @@ __all__ = [
     "set_context",
     "shutdown",
     "shutdown_tracer",
+    "snapshot_input",
     "traced_agent",
     "traced_browser_action",
     "traced_http_call",
@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from .dispatcher import BackgroundDispatcher
     from .handlers import LogHandler
     from .outputs import LogOutput
 
@@ -33,6 +34,10 @@ class ObservabilityConfig:
         otel_insecure: Whether to use insecure connection to collector
         console_enabled: Whether to output to console (dev only)
         console_color: Whether to use colored console output
+        background_emit: Whether logs are delivered (and component start/end
+            logs also built) on a background thread instead of the caller's
+        capture_stack_trace: Whether component error logs include the
+            formatted stack trace (spans record the exception regardless)
     """
 
     service_name: str = "crawler-agent"
@@ -45,6 +50,12 @@ class ObservabilityConfig:
     console_enabled: bool = True
     console_color: bool = True
 
+    # Background emission (moves component logging off the call path)
+    background_emit: bool = False
+
+    # Error logs
+    capture_stack_trace: bool = True
+
     def create_console_output(self) -> Optional["LogOutput"]:
         """Create console output if enabled.
 
@@ -68,6 +79,9 @@ class ObservabilityConfig:
             OTEL_INSECURE: Use insecure connection (default: true)
             LOG_CONSOLE: Enable console output (default: true)
             LOG_COLOR: Enable colored console (default: true)
+            LOG_BACKGROUND_EMIT: Deliver logs from a background thread
+                (default: false)
+            LOG_STACK_TRACE: Include stack traces in error logs (default: true)
 
         Returns:
             ObservabilityConfig loaded from environment.
@@ -78,13 +92,17 @@ class ObservabilityConfig:
             otel_insecure=os.environ.get("OTEL_INSECURE", "true").lower() == "true",
             console_enabled=os.environ.get("LOG_CONSOLE", "true").lower() == "true",
             console_color=os.environ.get("LOG_COLOR", "true").lower() == "true",
+            background_emit=os.environ.get("LOG_BACKGROUND_EMIT", "false").lower() == "true",
+            capture_stack_trace=os.environ.get("LOG_STACK_TRACE", "true").lower() == "true",
         )
 
 
 # Global state
 _handler: Optional["LogHandler"] = None
 _console_output: Optional["LogOutput"] = None
+_dispatcher: Optional["BackgroundDispatcher"] = None
 _initialized: bool = False
+_has_log_sinks: bool = False
 _config: ObservabilityConfig | None = None
 
 
@@ -97,12 +115,13 @@ def initialize_observability(
     1. OTel tracer (for span creation in decorators)
     2. Log handler (for log emission)
     3. Console output (optional)
+    4. Background dispatcher (optional)
 
     Args:
         handler: LogHandler instance (injected by caller).
         config: Configuration to use. Loads from env if None.
     """
-    global _handler, _console_output, _initialized, _config
+    global _handler, _console_output, _dispatcher, _initialized, _has_log_sinks, _config
 
     if config is None:
         config = ObservabilityConfig.from_env()
@@ -120,6 +139,19 @@ def initialize_observability(
 
     _handler = handler
     _console_output = config.create_console_output()
+    # Duck-typed handlers without is_active() are assumed to deliver
+    is_active = getattr(handler, "is_active", None)
+    _has_log_sinks = (is_active is None or is_active()) or _console_output is not None
+
+    if config.background_emit and _dispatcher is None:
+        from .dispatcher import BackgroundDispatcher
+        from .emitters import _emit_drop_summary
+
+        _dispatcher = BackgroundDispatcher(on_drop=_emit_drop_summary)
+    elif not config.background_emit and _dispatcher is not None:
+        _dispatcher.close()
+        _dispatcher = None
+
     _initialized = True
 
 
@@ -133,6 +165,11 @@ def get_console_output() -> Optional["LogOutput"]:
     return _console_output
 
 
+def get_dispatcher() -> Optional["BackgroundDispatcher"]:
+    """Get the background dispatcher if background emission is enabled."""
+    return _dispatcher
+
+
 def get_config() -> ObservabilityConfig | None:
     """Get current configuration."""
     return _config
@@ -143,9 +180,26 @@ def is_initialized() -> bool:
     return _initialized
 
 
+def has_log_sinks() -> bool:
+    """Check if emitted logs would reach a handler or the console.
+
+    False before initialization, and when the handler discards everything
+    (e.g. NullHandler) with console output disabled.
+
+    Computed once by initialize_observability(). Changing the handler set
+    afterwards (e.g. appending to CompositeHandler.handlers) is not picked
+    up until initialize_observability() is called again.
+    """
+    return _has_log_sinks
+
+
 def shutdown() -> None:
     """Shutdown the observability system."""
-    global _handler, _console_output, _initialized, _config
+    global _handler, _console_output, _dispatcher, _initialized, _has_log_sinks, _config
+
+    # Emit everything still queued while the handler is alive
+    if _dispatcher:
+        _dispatcher.close()
 
     # Shutdown tracer
     from .tracer import shutdown_tracer
@@ -161,5 +215,7 @@ def shutdown() -> None:
 
     _handler = None
     _console_output = None
+    _dispatcher = None
     _initialized = False
+    _has_log_sinks = False
     _config = None
@@ -2,51 +2,214 @@
 
 This module provides context propagation that:
 1. Gets trace_id, span_id, parent_span_id from OTel span context
-2. Manages business metadata (session_id, request_id, component_stack) separately
+2. Manages business metadata (session_id, request_id, component chain) separately
 
 The ObservabilityContext wraps an OTel span and carries our business fields.
 """
 
 import contextvars
-import uuid
+import itertools
+import os
+import secrets
+import time
+import weakref
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import Any, Optional
+from types import TracebackType
+from typing import Any, Literal, Optional
 
 from opentelemetry import trace
 
-from .tracer import format_span_id, format_trace_id
+from .schema import format_timestamp_ns
+from .tracer import get_tracer
 
 # Global context storage for business metadata
 _observability_context: contextvars.ContextVar["ObservabilityContext"] = contextvars.ContextVar(
     "observability_context", default=None
 )
 
+# Session/request IDs only need to be unique, not unpredictable: a random
+# per-process prefix plus a counter avoids a urandom read per ID.
+_id_prefix = secrets.token_hex(6)
+_id_counter = itertools.count()
 
-@dataclass
+
+def _reseed_ids() -> None:
+    """Give a forked child its own ID prefix."""
+    global _id_prefix, _id_counter
+    _id_prefix = secrets.token_hex(6)
+    _id_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reseed_ids)
+
+
+def _span_ids(span: Any) -> tuple[str, str, str | None]:
+    """Read trace_id, span_id and parent_span_id from a span.
+
+    Args:
+        span: OTel span
+
+    Returns:
+        Tuple of (trace_id, span_id, parent_span_id), empty IDs if invalid.
+    """
+    ctx = span.get_span_context()
+    # Same formats as tracer.format_trace_id/format_span_id, inlined to
+    # skip two calls per resolution
+    if ctx.is_valid:
+        trace_id = f"{ctx.trace_id:032x}"
+        span_id = f"{ctx.span_id:016x}"
+    else:
+        trace_id = span_id = ""
+
+    parent_span_id = None
+    # OTel SDK spans have a parent attribute with the parent SpanContext
+    parent_ctx = getattr(span, "parent", None)
+    if parent_ctx is not None and getattr(parent_ctx, "span_id", None):
+        parent_span_id = f"{parent_ctx.span_id:016x}"
+    return trace_id, span_id, parent_span_id
+
+
+def _new_id(kind: str) -> str:
+    """Generate a process-unique ID such as 'sess_1a2b3c4d5e6f0000'.
+
+    Args:
+        kind: ID prefix ('sess' or 'req').
+
+    Returns:
+        Prefixed ID with at least 16 hex characters.
+    """
+    return f"{kind}_{_id_prefix}{next(_id_counter):04x}"
+
+
+@dataclass(slots=True, init=False)
 class ObservabilityContext:
     """Hybrid observability context: OTel span + business metadata.
 
     trace_id/span_id/parent_span_id come from OTel span context (via properties).
-    Business fields (session_id, request_id, component_stack) are managed by us.
+    Business fields (session_id, request_id, component chain) are managed by us.
+
+    A context is created for every traced call, so the class is slotted to
+    avoid allocating a per-instance ``__dict__``.
 
     Attributes:
         session_id: Session identifier (preserved across spans)
         request_id: Request identifier (preserved across spans)
-        component_stack: Stack of component names for triggered_by tracking
-        start_time: When this context was created
-        _span: Reference to OTel span (for extracting IDs)
+        component_name: Name of the component this context belongs to
+        start_time: When this context was created (ns since epoch, time.time_ns())
+        _parent: Context of the component that triggered this one. Children
+            link to their parent instead of copying a stack of names, so
+            create_child() is O(1); component_stack is derived on demand.
+        _span: Weak reference to the OTel span. Passed in as the span
+            itself; its IDs are read immediately and the span is then held
+            weakly, so a context that outlives its span keeps its IDs but
+            doesn't keep the span alive.
+
+    The constructor still accepts a ``component_stack`` list of names, as in
+    earlier versions; it is turned into the equivalent chain of parents.
     """
 
     # Business metadata (WE manage these - not OTel)
     session_id: str | None = None
     request_id: str | None = None
-    component_stack: list[str] = field(default_factory=list)
-    start_time: datetime = field(default_factory=lambda: datetime.now(UTC))
+    component_name: str | None = None
+    start_time: int = field(default_factory=time.time_ns)
+    _parent: Optional["ObservabilityContext"] = field(default=None, repr=False, compare=False)
 
     # OTel span reference (for extracting IDs) - not serialized
     _span: Any | None = field(default=None, repr=False, compare=False)
 
+    # IDs of _span, read when the span is attached. Contexts without a span
+    # read the current span instead and leave _trace_id_cache as None.
+    _trace_id_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+    _span_id_cache: str = field(default="", init=False, repr=False, compare=False)
+    _parent_span_id_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        session_id: str | None = None,
+        request_id: str | None = None,
+        component_name: str | None = None,
+        start_time: int | None = None,
+        _parent: Optional["ObservabilityContext"] = None,
+        _span: Any | None = None,
+        *,
+        component_stack: Sequence[str] | None = None,
+    ) -> None:
+        """Initialize the context.
+
+        Args:
+            session_id: Session identifier
+            request_id: Request identifier
+            component_name: Name of the component this context belongs to
+            start_time: Creation time in ns since epoch (defaults to now)
+            _parent: Context of the triggering component
+            _span: OTel span to attach (held weakly), or a weak reference
+                to one as stored by another context
+            component_stack: Component names, outermost first. The last name
+                becomes component_name and the others become parent contexts
+                sharing this context's session and request IDs.
+
+        Raises:
+            TypeError: If component_stack is combined with component_name or
+                _parent.
+        """
+        if start_time is None:
+            start_time = time.time_ns()
+        if component_stack:
+            if component_name is not None or _parent is not None:
+                raise TypeError("component_stack cannot be combined with component_name or _parent")
+            *outer, component_name = component_stack
+            for name in outer:
+                _parent = ObservabilityContext(
+                    session_id, request_id, name, start_time, _parent=_parent
+                )
+
+        self.session_id = session_id
+        self.request_id = request_id
+        self.component_name = component_name
+        self.start_time = start_time
+        self._parent = _parent
+        self._trace_id_cache = None
+        self._span_id_cache = ""
+        self._parent_span_id_cache = None
+        self._span = None
+        if _span is None:
+            return
+
+        # Read the IDs while the span is certainly alive, then hold it weakly.
+        # A weak reference (e.g. from dataclasses.replace) is kept as-is.
+        if isinstance(_span, weakref.ref):
+            self._span = _span
+            _span = _span()
+        else:
+            self._span = weakref.ref(_span)
+        if _span is None:
+            self._trace_id_cache = ""
+        else:
+            self._trace_id_cache, self._span_id_cache, self._parent_span_id_cache = _span_ids(_span)
+
+    @property
+    def has_span(self) -> bool:
+        """Whether an OTel span is attached.
+
+        Span-less contexts take their IDs from whichever span is current
+        when they are read, so they must be read on the caller's thread.
+        """
+        return self._span is not None
+
+    def resolve_ids(self) -> tuple[str, str, str | None]:
+        """Get trace_id, span_id and parent_span_id together.
+
+        Returns:
+            Tuple of (trace_id, span_id, parent_span_id). Contexts with a span
+            return the IDs read when it was attached; span-less contexts read
+            the current span.
+        """
+        if self._trace_id_cache is not None:
+            return self._trace_id_cache, self._span_id_cache, self._parent_span_id_cache
+        return _span_ids(trace.get_current_span())
+
     @property
     def trace_id(self) -> str:
         """Get trace_id from OTel span context.
@@ -54,11 +217,7 @@ class ObservabilityContext:
         Returns:
             32-character hex string or empty string if no valid span
         """
-        span = self._span or trace.get_current_span()
-        ctx = span.get_span_context()
-        if ctx.is_valid:
-            return format_trace_id(ctx.trace_id)
-        return ""
+        return self.resolve_ids()[0]
 
     @property
     def span_id(self) -> str:
@@ -67,11 +226,7 @@ class ObservabilityContext:
         Returns:
             16-character hex string or empty string if no valid span
         """
-        span = self._span or trace.get_current_span()
-        ctx = span.get_span_context()
-        if ctx.is_valid:
-            return format_span_id(ctx.span_id)
-        return ""
+        return self.resolve_ids()[1]
 
     @property
     def parent_span_id(self) -> str | None:
@@ -83,13 +238,23 @@ class ObservabilityContext:
         Returns:
             16-character hex string or None if no parent
         """
-        span = self._span or trace.get_current_span()
-        # OTel SDK spans have a parent attribute with the parent SpanContext
-        if hasattr(span, "parent") and span.parent is not None:
-            parent_ctx = span.parent
-            if hasattr(parent_ctx, "span_id") and parent_ctx.span_id:
-                return format_span_id(parent_ctx.span_id)
-        return None
+        return self.resolve_ids()[2]
+
+    @property
+    def component_stack(self) -> tuple[str, ...]:
+        """Get the names of all components from the root to this one.
+
+        Returns:
+            Tuple of component names, outermost first.
+        """
+        names = []
+        node: ObservabilityContext | None = self
+        while node is not None:
+            if node.component_name is not None:
+                names.append(node.component_name)
+            node = node._parent
+        names.reverse()
+        return tuple(names)
 
     @property
     def triggered_by(self) -> str:
@@ -98,8 +263,8 @@ class ObservabilityContext:
         Returns:
             Name of the component that triggered this one, or 'direct_call'.
         """
-        if len(self.component_stack) > 1:
-            return self.component_stack[-2]
+        if self._parent is not None and self._parent.component_name is not None:
+            return self._parent.component_name
         return "direct_call"
 
     @property
@@ -109,9 +274,18 @@ class ObservabilityContext:
         Returns:
             Name of the current component, or 'unknown'.
         """
-        if self.component_stack:
-            return self.component_stack[-1]
-        return "unknown"
+        return self.component_name or "unknown"
+
+    @property
+    def start_time_iso(self) -> str:
+        """Get start_time as an ISO 8601 UTC string.
+
+        Formatted on demand - most contexts are never serialized.
+
+        Returns:
+            ISO 8601 timestamp with microsecond precision
+        """
+        return format_timestamp_ns(self.start_time)
 
     @classmethod
     def get_current(cls) -> Optional["ObservabilityContext"]:
@@ -136,16 +310,16 @@ class ObservabilityContext:
             New root ObservabilityContext with business metadata.
         """
         return cls(
-            session_id=session_id or f"sess_{uuid.uuid4().hex[:12]}",
-            request_id=f"req_{uuid.uuid4().hex[:12]}",
-            component_stack=["root"],
+            session_id=session_id or _new_id("sess"),
+            request_id=_new_id("req"),
+            component_name="root",
             _span=None,  # Will be set when entering a traced decorator
         )
 
     def create_child(self, component_name: str, span: Any = None) -> "ObservabilityContext":
         """Create a child context with inherited business metadata.
 
-        The child inherits session_id, request_id and extends component_stack.
+        The child inherits session_id, request_id and links back to this context.
         trace_id/span_id come from the OTel span (passed or current).
 
         Args:
@@ -158,7 +332,8 @@ class ObservabilityContext:
         return ObservabilityContext(
             session_id=self.session_id,
             request_id=self.request_id,
-            component_stack=[*self.component_stack, component_name],
+            component_name=component_name,
+            _parent=self,
             _span=span or trace.get_current_span(),
         )
 
@@ -176,8 +351,9 @@ class ObservabilityContext:
         return ObservabilityContext(
             session_id=self.session_id,
             request_id=self.request_id,
-            component_stack=self.component_stack.copy(),
+            component_name=self.component_name,
             start_time=self.start_time,
+            _parent=self._parent,
             _span=span,
         )
 
@@ -187,15 +363,16 @@ class ObservabilityContext:
         Returns:
             Dictionary representation of the context.
         """
+        trace_id, span_id, parent_span_id = self.resolve_ids()
         return {
-            "trace_id": self.trace_id,
-            "span_id": self.span_id,
-            "parent_span_id": self.parent_span_id,
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "parent_span_id": parent_span_id,
             "session_id": self.session_id,
             "request_id": self.request_id,
             "triggered_by": self.triggered_by,
-            "component_stack": self.component_stack,
-            "start_time": self.start_time.isoformat(),
+            "component_stack": list(self.component_stack),
+            "start_time": self.start_time_iso,
         }
 
 
@@ -210,16 +387,41 @@ def get_or_create_context(component_name: str = "unknown") -> "ObservabilityCont
     """
     ctx = _observability_context.get()
     if ctx is None:
-        ctx = ObservabilityContext.create_root()
         ctx = ObservabilityContext(
-            session_id=ctx.session_id,
-            request_id=ctx.request_id,
-            component_stack=[component_name],
+            session_id=_new_id("sess"),
+            request_id=_new_id("req"),
+            component_name=component_name,
             _span=trace.get_current_span(),
         )
     return ctx
 
 
+def create_span_context(component_name: str, span: Any) -> ObservabilityContext:
+    """Create the context for a component entering a new OTel span.
+
+    Child of the current context if one is active. Otherwise the component
+    is the root of a new session and its context is built directly, without
+    an intermediate root context.
+
+    Args:
+        component_name: Name of the component entering the span.
+        span: OTel span started for the component.
+
+    Returns:
+        New ObservabilityContext bound to the span.
+    """
+    parent = _observability_context.get()
+    if parent is not None:
+        return parent.create_child(component_name, span)
+
+    return ObservabilityContext(
+        session_id=_new_id("sess"),
+        request_id=_new_id("req"),
+        component_name=component_name,
+        _span=span,
+    )
+
+
 def set_context(ctx: ObservabilityContext) -> contextvars.Token:
     """Set the current observability context.
 
@@ -253,7 +455,7 @@ class ObservabilitySpan:
         with ObservabilitySpan("my_component") as ctx:
             # Code runs with child context
             # ctx has trace_id, span_id from OTel
-            # ctx has session_id, request_id, component_stack from us
+            # ctx has session_id, request_id, component chain from us
             pass
     """
 
@@ -273,36 +475,26 @@ class ObservabilitySpan:
         """Enter the span context.
 
         Returns:
-            The child context for this span.
+            The context for this span (a child, or a root if none is active).
         """
-        from .tracer import get_tracer
-
         # Start OTel span
         tracer = get_tracer()
         self._otel_span = tracer.start_span(self.component_name)
         self._otel_token = trace.use_span(self._otel_span, end_on_exit=False)
         self._otel_token.__enter__()
 
-        # Get or create parent context
-        existing_ctx = _observability_context.get()
-
-        if existing_ctx is None:
-            # No existing context - create root with this component as first entry
-            self.context = ObservabilityContext(
-                session_id=f"sess_{uuid.uuid4().hex[:12]}",
-                request_id=f"req_{uuid.uuid4().hex[:12]}",
-                component_stack=[self.component_name],
-                _span=self._otel_span,
-            )
-        else:
-            # Existing context - create child with inherited business metadata
-            self.context = existing_ctx.create_child(self.component_name, self._otel_span)
-
+        # Child of the existing context, or a new root with this component first
+        self.context = create_span_context(self.component_name, self._otel_span)
         self.token = set_context(self.context)
 
         return self.context
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> Literal[False]:
         """Exit the span context."""
         # End OTel span
         if self._otel_span is not None:
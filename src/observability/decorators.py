@@ -13,18 +13,18 @@ Usage:
         return {"success": True}
 """
 
-import asyncio
 import inspect
 import time
 from collections.abc import Callable
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, TypeVar
 
-from opentelemetry.trace import SpanKind, Status, StatusCode
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
 
+from .config import is_initialized
 from .context import (
     ObservabilityContext,
-    get_or_create_context,
+    create_span_context,
     reset_context,
     set_context,
 )
@@ -32,12 +32,21 @@ from .emitters import (
     emit_component_end,
     emit_component_error,
     emit_component_start,
+    snapshot_input,
 )
-from .serializers import safe_serialize
 from .tracer import get_tracer
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# (skip_first, param_names) resolved once per decorated function
+_InputParams = tuple[bool, tuple[str, ...]]
+
+# Marker for attributes that are absent (as opposed to set to None)
+_MISSING: Any = object()
+
+# The only non-scalar LLM metric - logged, but never set as a span attribute
+_TOOL_CALLS_METRIC = "llm.response.tool_calls"
+
 
 def _get_effective_name(provided_name: str | None, args: tuple, func: Callable) -> str:
     """Get effective component name, checking self.name for methods.
@@ -56,7 +65,7 @@ def _get_effective_name(provided_name: str | None, args: tuple, func: Callable)
         Effective name to use for tracing
     """
     # Check if this is a method call with self.name
-    if args and hasattr(args[0], "name"):
+    if args:
         instance_name = getattr(args[0], "name", None)
         if instance_name:
             return instance_name
@@ -65,7 +74,76 @@ def _get_effective_name(provided_name: str | None, args: tuple, func: Callable)
     return provided_name or func.__name__
 
 
-def traced_tool(name: str | None = None) -> Callable[[F], F]:
+def _is_reentrant_call(name: str) -> bool:
+    """Check whether the named component is already the current component.
+
+    Args:
+        name: Effective component name of the call
+
+    Returns:
+        True if the active context belongs to a component with this name
+    """
+    ctx = ObservabilityContext.get_current()
+    return ctx is not None and ctx.component_name == name
+
+
+def _trace_callable(
+    func: F,
+    component_type: str,
+    default_name: str,
+    resolve_name: Callable[[tuple], str],
+    reentrant_skip: bool = False,
+) -> F:
+    """Build the tracing wrapper shared by all decorators.
+
+    Everything that depends only on func (signature, sync/async, whether
+    the name can vary per call) is resolved here, once.
+
+    Args:
+        func: The function being decorated
+        component_type: Type of component (tool, agent, llm)
+        default_name: Component name used when func is a plain function
+        resolve_name: Resolves the name from call args for methods
+        reentrant_skip: Run re-entrant calls of the same component untraced
+
+    Returns:
+        Sync or async wrapper matching func
+    """
+    params = _get_input_params(func)
+    # Plain functions have no instance that could override the name
+    static_name = default_name if params is not None and not params[0] else None
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Nothing would be recorded - skip naming, span, context and input capture
+            if not is_initialized():
+                return await func(*args, **kwargs)
+            effective_name = static_name or resolve_name(args)
+            if reentrant_skip and _is_reentrant_call(effective_name):
+                return await func(*args, **kwargs)
+            return await _execute_with_tracing_async(
+                func, effective_name, component_type, args, kwargs, params
+            )
+
+        return async_wrapper
+
+    @wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not is_initialized():
+            return func(*args, **kwargs)
+        effective_name = static_name or resolve_name(args)
+        if reentrant_skip and _is_reentrant_call(effective_name):
+            return func(*args, **kwargs)
+        return _execute_with_tracing_sync(
+            func, effective_name, component_type, args, kwargs, params
+        )
+
+    return sync_wrapper
+
+
+def traced_tool(name: str | None = None, reentrant_skip: bool = False) -> Callable[[F], F]:
     """Decorator for tool functions/methods.
 
     Creates a child OTel span under the current active span.
@@ -82,6 +160,10 @@ def traced_tool(name: str | None = None) -> Callable[[F], F]:
     Args:
         name: Tool name for identification. If None, uses self.name from the
               instance (for class methods) or the function name as fallback.
+        reentrant_skip: If True, a call made while this same tool is already
+              the current component runs untraced as part of the enclosing
+              call (no span, context or logs). Off by default so every call
+              is logged.
 
     Usage:
         @traced_tool(name="WebSearch")
@@ -95,27 +177,18 @@ def traced_tool(name: str | None = None) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
-        if asyncio.iscoroutinefunction(func):
-
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                effective_name = _get_effective_name(name, args, func)
-                return await _execute_with_tracing_async(func, effective_name, "tool", args, kwargs)
-
-            return async_wrapper
-        else:
-
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                effective_name = _get_effective_name(name, args, func)
-                return _execute_with_tracing_sync(func, effective_name, "tool", args, kwargs)
-
-            return sync_wrapper
+        return _trace_callable(
+            func,
+            "tool",
+            name or getattr(func, "__name__", "unknown"),
+            partial(_get_effective_name, name, func=func),
+            reentrant_skip,
+        )
 
     return decorator
 
 
-def traced_agent(name: str | None = None) -> Callable[[F], F]:
+def traced_agent(name: str | None = None, reentrant_skip: bool = False) -> Callable[[F], F]:
     """Decorator for agent run methods.
 
     Creates an OTel span for the agent execution.
@@ -131,27 +204,19 @@ def traced_agent(name: str | None = None) -> Callable[[F], F]:
     Args:
         name: Agent name for identification. If None, uses self.name from the
               instance (for class methods) or the function name as fallback.
+        reentrant_skip: If True, a call made while this same agent is already
+              the current component runs untraced as part of the enclosing
+              call. Off by default so every call is logged.
     """
 
     def decorator(func: F) -> F:
-        if asyncio.iscoroutinefunction(func):
-
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                effective_name = _get_effective_name(name, args, func)
-                return await _execute_with_tracing_async(
-                    func, effective_name, "agent", args, kwargs
-                )
-
-            return async_wrapper
-        else:
-
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                effective_name = _get_effective_name(name, args, func)
-                return _execute_with_tracing_sync(func, effective_name, "agent", args, kwargs)
-
-            return sync_wrapper
+        return _trace_callable(
+            func,
+            "agent",
+            name or getattr(func, "__name__", "unknown"),
+            partial(_get_effective_name, name, func=func),
+            reentrant_skip,
+        )
 
     return decorator
 
@@ -176,22 +241,7 @@ def traced_llm_client(provider: str) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
-        if asyncio.iscoroutinefunction(func):
-
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                effective_name = _get_llm_effective_name(provider, args)
-                return await _execute_with_tracing_async(func, effective_name, "llm", args, kwargs)
-
-            return async_wrapper
-        else:
-
-            @wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                effective_name = _get_llm_effective_name(provider, args)
-                return _execute_with_tracing_sync(func, effective_name, "llm", args, kwargs)
-
-            return sync_wrapper
+        return _trace_callable(func, "llm", provider, partial(_get_llm_effective_name, provider))
 
     return decorator
 
@@ -206,48 +256,65 @@ def _get_llm_effective_name(provider: str, args: tuple) -> str:
     Returns:
         Name like "openai:main_agent" or just "openai"
     """
-    if args and hasattr(args[0], "component_name"):
+    if args:
         component_name = getattr(args[0], "component_name", None)
         if component_name:
             return f"{provider}:{component_name}"
     return provider
 
 
-def _prepare_input_data(args: tuple, kwargs: dict, func: Callable) -> dict:
+def _get_input_params(func: Callable) -> _InputParams | None:
+    """Resolve how positional arguments of a decorated function are logged.
+
+    Called once at decoration time - the signature of a function never
+    changes, so there is no need to inspect it on every call.
+
+    Args:
+        func: The function being decorated
+
+    Returns:
+        Tuple of (skip_first, param_names) where skip_first is True for methods
+        whose first parameter is 'self' or 'cls' (excluded from param_names),
+        or None if the signature can't be inspected
+    """
+    try:
+        names = tuple(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return None
+
+    # Skip 'self' or 'cls' for methods
+    if names and names[0] in ("self", "cls"):
+        return True, names[1:]
+    return False, names
+
+
+def _prepare_input_data(args: tuple, kwargs: dict, params: _InputParams | None) -> dict:
     """Prepare input data for logging.
 
-    Handles special cases like 'self' argument for methods.
+    Handles special cases like 'self' argument for methods. Values are not
+    serialized here: emit_log serializes the whole payload once.
 
     Args:
         args: Positional arguments
         kwargs: Keyword arguments
-        func: The function being called
+        params: Result of _get_input_params for the called function
 
     Returns:
-        Dictionary with serializable input data
+        Dictionary with named input values
     """
-    try:
-        sig = inspect.signature(func)
-        params = list(sig.parameters.keys())
-
-        # Skip 'self' or 'cls' for methods
-        args_to_log = args
-        if params and params[0] in ("self", "cls") and len(args) > 0:
-            args_to_log = args[1:]
-            params = params[1:]
-
-        # Build named args dict
-        named_args = {}
-        for i, arg in enumerate(args_to_log):
-            if i < len(params):
-                named_args[params[i]] = arg
-            else:
-                named_args[f"arg_{i}"] = arg
-
-        return {"args": safe_serialize(named_args), "kwargs": safe_serialize(kwargs)}
-    except Exception:
+    if params is None:
         # Fallback to simple serialization
-        return {"args": safe_serialize(args[1:] if args else []), "kwargs": safe_serialize(kwargs)}
+        return {"args": list(args[1:]), "kwargs": kwargs}
+
+    skip_first, names = params
+    args_to_log = args[1:] if skip_first else args
+
+    # Build named args dict - extra positionals (*args) get numbered names
+    named_args = dict(zip(names, args_to_log, strict=False))
+    for i in range(len(names), len(args_to_log)):
+        named_args[f"arg_{i}"] = args_to_log[i]
+
+    return {"args": named_args, "kwargs": kwargs}
 
 
 def _prepare_llm_input_data(args: tuple, kwargs: dict) -> dict:
@@ -270,7 +337,7 @@ def _prepare_llm_input_data(args: tuple, kwargs: dict) -> dict:
     # Extract messages (first positional arg after self)
     if len(args) > 1:
         messages = args[1]
-        result["messages"] = safe_serialize(messages)
+        result["messages"] = messages
 
     # Extract tools (second positional arg after self) - just names
     if len(args) > 2 and args[2]:
@@ -320,7 +387,7 @@ def _prepare_llm_output_data(result: Any) -> dict:
         if "tool_called" in result:
             output["tool_called"] = result["tool_called"]
 
-    return safe_serialize(output)
+    return output
 
 
 def _get_span_name(component_type: str, name: str) -> str:
@@ -329,139 +396,160 @@ def _get_span_name(component_type: str, name: str) -> str:
 
 
 def _prepare_tracing(
-    component_type: str, name: str, args: tuple, kwargs: dict, func: Callable
+    component_type: str,
+    name: str,
+    args: tuple,
+    kwargs: dict,
+    params: _InputParams | None,
 ) -> tuple:
     """Prepare tracing context before span creation.
 
     Returns:
-        Tuple of (tracer, span_name, parent_ctx, input_data)
+        Tuple of (tracer, span_name, input_data snapshot)
     """
     tracer = get_tracer()
     span_name = _get_span_name(component_type, name)
-    parent_ctx = get_or_create_context(name)
 
     # Prepare input data - use simplified format for LLM calls
     if component_type == "llm":
         input_data = _prepare_llm_input_data(args, kwargs)
     else:
-        input_data = _prepare_input_data(args, kwargs, func)
+        input_data = _prepare_input_data(args, kwargs, params)
 
-    return tracer, span_name, parent_ctx, input_data
+    # One snapshot for the start and error logs - the call may mutate its inputs
+    return tracer, span_name, snapshot_input(input_data)
 
 
-def _setup_span(
-    span, parent_ctx: ObservabilityContext, component_type: str, name: str, input_data: dict
-) -> tuple:
+def _setup_span(span: Span, component_type: str, name: str, input_data: dict) -> tuple:
     """Setup span attributes and context.
 
     Returns:
         Tuple of (ctx, token)
     """
-    span.set_attribute("component.type", component_type)
-    span.set_attribute("component.name", name)
-    span.set_attribute("session.id", parent_ctx.session_id or "")
-    span.set_attribute("request.id", parent_ctx.request_id or "")
+    ctx = create_span_context(name, span)
+
+    # One bulk call - the SDK span takes its lock once per call
+    span.set_attributes(
+        {
+            "component.type": component_type,
+            "component.name": name,
+            "session.id": ctx.session_id or "",
+            "request.id": ctx.request_id or "",
+        }
+    )
 
-    ctx = parent_ctx.create_child(name, span)
     token = set_context(ctx)
 
-    emit_component_start(component_type, name, ctx, input_data)
+    emit_component_start(component_type, name, ctx, input_data, serialized=True)
 
     return ctx, token
 
 
 def _handle_success(
-    span,
+    span: Span,
     component_type: str,
     name: str,
     ctx: ObservabilityContext,
     result: Any,
-    start_time: float,
+    start_ns: int,
     kwargs: dict,
 ) -> None:
     """Handle successful execution - set span status and emit logs."""
-    duration_ms = (time.perf_counter() - start_time) * 1000
-
-    span.set_status(Status(StatusCode.OK))
-    span.set_attribute("duration_ms", duration_ms)
-
-    # Extract metrics for LLM calls
-    metrics = {}
-    if component_type == "llm":
-        metrics = _extract_llm_metrics(result, kwargs)
-        for key, value in metrics.items():
-            if isinstance(value, (str, int, float, bool)):
-                span.set_attribute(key, value)
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+    # Extract metrics for LLM calls - they also become span attributes
+    metrics = _extract_llm_metrics(result, kwargs) if component_type == "llm" else None
+
+    if span.is_recording():
+        span.set_status(Status(StatusCode.OK))
+        if metrics:
+            # Every metric is a scalar except the tool call list. The SDK
+            # validates values itself and drops anything unsupported.
+            attributes = metrics.copy()
+            attributes.pop(_TOOL_CALLS_METRIC, None)
+            attributes["duration_ms"] = duration_ms
+            span.set_attributes(attributes)
+        else:
+            span.set_attribute("duration_ms", duration_ms)
 
-    # Prepare output data - use simplified format for LLM
-    if component_type == "llm":
-        output_data = _prepare_llm_output_data(result)
-    else:
-        output_data = safe_serialize(result)
+    # Prepare output data - use simplified format for LLM.
+    # Not serialized here: emit_log serializes the whole payload once.
+    output_data = _prepare_llm_output_data(result) if component_type == "llm" else result
 
     emit_component_end(component_type, name, ctx, output_data, duration_ms, metrics)
 
 
 def _handle_error(
-    span,
+    span: Span,
     component_type: str,
     name: str,
     ctx: ObservabilityContext,
     exception: Exception,
     input_data: dict,
-    start_time: float,
+    start_ns: int,
 ) -> None:
     """Handle execution error - set span status and emit error logs."""
-    duration_ms = (time.perf_counter() - start_time) * 1000
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
-    span.set_status(Status(StatusCode.ERROR, str(exception)))
-    span.record_exception(exception)
-    span.set_attribute("duration_ms", duration_ms)
+    # Sampled-out spans drop all of this - skip building the status and
+    # exception event. The error log below is emitted either way.
+    if span.is_recording():
+        span.set_status(Status(StatusCode.ERROR, str(exception)))
+        span.record_exception(exception)
+        span.set_attribute("duration_ms", duration_ms)
 
-    emit_component_error(component_type, name, ctx, exception, input_data, duration_ms)
+    emit_component_error(
+        component_type, name, ctx, exception, input_data, duration_ms, serialized=True
+    )
 
 
 def _execute_with_tracing_sync(
-    func: Callable, name: str, component_type: str, args: tuple, kwargs: dict
+    func: Callable,
+    name: str,
+    component_type: str,
+    args: tuple,
+    kwargs: dict,
+    params: _InputParams | None = None,
 ) -> Any:
     """Core tracing execution logic for synchronous functions."""
-    tracer, span_name, parent_ctx, input_data = _prepare_tracing(
-        component_type, name, args, kwargs, func
-    )
+    tracer, span_name, input_data = _prepare_tracing(component_type, name, args, kwargs, params)
 
     with tracer.start_as_current_span(name=span_name, kind=SpanKind.INTERNAL) as span:
-        ctx, token = _setup_span(span, parent_ctx, component_type, name, input_data)
-        start_time = time.perf_counter()
+        ctx, token = _setup_span(span, component_type, name, input_data)
+        start_ns = time.perf_counter_ns()
 
         try:
             result = func(*args, **kwargs)
-            _handle_success(span, component_type, name, ctx, result, start_time, kwargs)
+            _handle_success(span, component_type, name, ctx, result, start_ns, kwargs)
             return result
         except Exception as e:
-            _handle_error(span, component_type, name, ctx, e, input_data, start_time)
+            _handle_error(span, component_type, name, ctx, e, input_data, start_ns)
             raise
         finally:
             reset_context(token)
 
 
 async def _execute_with_tracing_async(
-    func: Callable, name: str, component_type: str, args: tuple, kwargs: dict
+    func: Callable,
+    name: str,
+    component_type: str,
+    args: tuple,
+    kwargs: dict,
+    params: _InputParams | None = None,
 ) -> Any:
     """Core tracing execution logic for async functions."""
-    tracer, span_name, parent_ctx, input_data = _prepare_tracing(
-        component_type, name, args, kwargs, func
-    )
+    tracer, span_name, input_data = _prepare_tracing(component_type, name, args, kwargs, params)
 
     with tracer.start_as_current_span(name=span_name, kind=SpanKind.INTERNAL) as span:
-        ctx, token = _setup_span(span, parent_ctx, component_type, name, input_data)
-        start_time = time.perf_counter()
+        ctx, token = _setup_span(span, component_type, name, input_data)
+        start_ns = time.perf_counter_ns()
 
         try:
             result = await func(*args, **kwargs)
-            _handle_success(span, component_type, name, ctx, result, start_time, kwargs)
+            _handle_success(span, component_type, name, ctx, result, start_ns, kwargs)
             return result
         except Exception as e:
-            _handle_error(span, component_type, name, ctx, e, input_data, start_time)
+            _handle_error(span, component_type, name, ctx, e, input_data, start_ns)
             raise
         finally:
             reset_context(token)
@@ -471,6 +559,7 @@ def _extract_llm_metrics(result: Any, kwargs: dict) -> dict:
     """Extract LLM-specific metrics from response.
 
     Handles various response formats from different LLM providers.
+    None values are never inserted, so no filtering pass is needed.
 
     Args:
         result: LLM response object or dict
@@ -479,52 +568,59 @@ def _extract_llm_metrics(result: Any, kwargs: dict) -> dict:
     Returns:
         Dictionary with LLM metrics
     """
-    metrics = {}
-
-    # Extract from response object (OpenAI-style)
-    if hasattr(result, "usage"):
-        usage = result.usage
-        metrics["llm.tokens.input"] = getattr(usage, "prompt_tokens", 0)
-        metrics["llm.tokens.output"] = getattr(usage, "completion_tokens", 0)
-        metrics["llm.tokens.total"] = getattr(usage, "total_tokens", 0)
-
-    # Extract from dict result (our wrapper format)
-    elif isinstance(result, dict):
-        if "usage" in result:
-            metrics["llm.tokens.input"] = result["usage"].get("prompt_tokens", 0)
-            metrics["llm.tokens.output"] = result["usage"].get("completion_tokens", 0)
-            metrics["llm.tokens.total"] = result["usage"].get("total_tokens", 0)
-
-        # Handle our custom format
-        if "tokens_input" in result:
-            metrics["llm.tokens.input"] = result["tokens_input"]
-        if "tokens_output" in result:
-            metrics["llm.tokens.output"] = result["tokens_output"]
-        if "tokens_total" in result:
-            metrics["llm.tokens.total"] = result["tokens_total"]
-        if "estimated_cost_usd" in result:
-            metrics["llm.cost.total"] = result["estimated_cost_usd"]
-        if "finish_reason" in result:
-            metrics["llm.response.finish_reason"] = result["finish_reason"]
-        if "tool_called" in result:
-            metrics["llm.response.tool_called"] = result["tool_called"]
+    metrics: dict[str, Any] = {}
+
+    if isinstance(result, dict):
+        # Extract from dict result (our wrapper format)
+        get = result.get
+        usage = get("usage")
+        if usage:
+            if (value := usage.get("prompt_tokens", 0)) is not None:
+                metrics["llm.tokens.input"] = value
+            if (value := usage.get("completion_tokens", 0)) is not None:
+                metrics["llm.tokens.output"] = value
+            if (value := usage.get("total_tokens", 0)) is not None:
+                metrics["llm.tokens.total"] = value
+
+        # Handle our custom format (overrides usage)
+        if (value := get("tokens_input")) is not None:
+            metrics["llm.tokens.input"] = value
+        if (value := get("tokens_output")) is not None:
+            metrics["llm.tokens.output"] = value
+        if (value := get("tokens_total")) is not None:
+            metrics["llm.tokens.total"] = value
+        if (value := get("estimated_cost_usd")) is not None:
+            metrics["llm.cost.total"] = value
+        if (value := get("finish_reason")) is not None:
+            metrics["llm.response.finish_reason"] = value
+        if (value := get("tool_called")) is not None:
+            metrics["llm.response.tool_called"] = value
         # Extract tool_calls with full details (id, name, arguments)
-        if result.get("tool_calls"):
-            metrics["llm.response.tool_calls"] = result["tool_calls"]
+        if value := get("tool_calls"):
+            metrics[_TOOL_CALLS_METRIC] = value
 
-    # Model info - check result first (from LLMClient.chat), then kwargs, then fallback
-    if isinstance(result, dict) and "model" in result:
-        metrics["llm.model"] = result["model"]
+        # Model info - check result first (from LLMClient.chat), then kwargs
+        model = get("model") if "model" in result else kwargs.get("model", "unknown")
     else:
-        metrics["llm.model"] = kwargs.get("model", "unknown")
-
-    if kwargs.get("temperature") is not None:
-        metrics["llm.temperature"] = kwargs["temperature"]
-    if kwargs.get("max_tokens") is not None:
-        metrics["llm.max_tokens"] = kwargs["max_tokens"]
-
-    # Filter out None values
-    return {k: v for k, v in metrics.items() if v is not None}
+        # Extract from response object (OpenAI-style)
+        usage = getattr(result, "usage", _MISSING)
+        if usage is not _MISSING:
+            if (value := getattr(usage, "prompt_tokens", 0)) is not None:
+                metrics["llm.tokens.input"] = value
+            if (value := getattr(usage, "completion_tokens", 0)) is not None:
+                metrics["llm.tokens.output"] = value
+            if (value := getattr(usage, "total_tokens", 0)) is not None:
+                metrics["llm.tokens.total"] = value
+        model = kwargs.get("model", "unknown")
+
+    if model is not None:
+        metrics["llm.model"] = model
+    if (value := kwargs.get("temperature")) is not None:
+        metrics["llm.temperature"] = value
+    if (value := kwargs.get("max_tokens")) is not None:
+        metrics["llm.max_tokens"] = value
+
+    return metrics
 
 
 # Convenience decorators for specific use cases
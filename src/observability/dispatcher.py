@@ -0,0 +1,154 @@
+"""Background dispatch of log emission.
+
+This module moves log emission off the caller's critical path:
+- Callers append (func, args) to a bounded ring buffer - a single deque append
+- A daemon thread drains the buffer and runs the emission calls in order
+
+Emission order is preserved. If producers outrun the drain thread and the
+buffer is full, the OLDEST pending entries are dropped so callers never block.
+Drops are counted in BackgroundDispatcher.dropped and, if an on_drop callback
+is given, reported through it at most once per drop_report_interval.
+
+Usage:
+    dispatcher = BackgroundDispatcher()
+    dispatcher.submit(emit_component_start, "tool", "MyTool", ctx, input_data)
+    dispatcher.flush()  # Drain synchronously (e.g. before handler.flush())
+    dispatcher.close()
+"""
+
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+
+class BackgroundDispatcher:
+    """Ring buffer of pending emission calls drained by a daemon thread.
+
+    deque.append/popleft are atomic, so producers take no lock. The drain
+    lock only serializes consumers (the drain thread and flush() callers)
+    to keep emission order intact.
+
+    Attributes:
+        dropped: Number of pending calls discarded because the buffer was
+            full. Approximate under concurrent producers - it is read and
+            incremented without a lock.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 65536,
+        interval: float = 0.05,
+        on_drop: Callable[[int, int], None] | None = None,
+        drop_report_interval: float = 10.0,
+    ):
+        """Initialize and start the drain thread.
+
+        Args:
+            capacity: Maximum pending calls before the oldest are dropped.
+            interval: Seconds the drain thread sleeps when the buffer is empty.
+            on_drop: Called as on_drop(new_drops, total_drops) at the end of a
+                drain when calls were dropped since the last report. Runs
+                inside the drain, so emission it does is delivered inline.
+            drop_report_interval: Minimum seconds between on_drop calls.
+                Pending drops are always reported on close().
+        """
+        self._queue: deque[tuple[Callable[..., Any], tuple]] = deque(maxlen=capacity)
+        self._capacity = capacity
+        self.dropped = 0
+        self._on_drop = on_drop
+        self._drop_report_interval = drop_report_interval
+        self._reported_dropped = 0
+        self._last_drop_report = float("-inf")
+        self._interval = interval
+        self._drain_lock = threading.Lock()
+        self._draining = threading.local()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="observability-dispatcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        """Queue func(*args) for execution on the drain thread.
+
+        Args:
+            func: Emission function to call.
+            *args: Positional arguments for func.
+        """
+        queue = self._queue
+        if len(queue) == self._capacity:
+            # The append below evicts the oldest entry
+            self.dropped += 1
+        queue.append((func, args))
+
+    def flush(self) -> None:
+        """Run all pending calls in the calling thread."""
+        self._drain()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the drain thread after emitting everything still pending.
+
+        Args:
+            timeout: Seconds to wait for the drain thread to finish.
+        """
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._drain(final=True)
+
+    def in_drain(self) -> bool:
+        """Check whether the calling thread is running queued calls.
+
+        Emission code uses this to run directly instead of re-queueing
+        itself, which would reorder it behind later submissions.
+
+        Returns:
+            True while inside a drain (on the drain thread or in flush())
+        """
+        return getattr(self._draining, "active", False)
+
+    def _drain(self, final: bool = False) -> None:
+        """Run pending calls in FIFO order. Errors never propagate.
+
+        Args:
+            final: Report pending drops regardless of drop_report_interval.
+        """
+        with self._drain_lock:
+            self._draining.active = True
+            try:
+                queue = self._queue
+                while queue:
+                    func, args = queue.popleft()
+                    try:  # noqa: SIM105 - hot path, suppress() is slower
+                        func(*args)
+                    except Exception:
+                        pass
+                if self.dropped > self._reported_dropped:
+                    self._report_drops(final)
+            finally:
+                self._draining.active = False
+
+    def _report_drops(self, force: bool) -> None:
+        """Pass drops since the last report to on_drop, rate limited."""
+        now = time.monotonic()
+        on_drop = self._on_drop
+        if on_drop is None or (
+            not force and now - self._last_drop_report < self._drop_report_interval
+        ):
+            return
+        total = self.dropped
+        new = total - self._reported_dropped
+        self._reported_dropped = total
+        self._last_drop_report = now
+        with contextlib.suppress(Exception):
+            on_drop(new, total)
+
+    def _run(self) -> None:
+        """Drain thread main loop."""
+        while not self._closed:
+            self._wakeup.wait(self._interval)
+            self._drain()
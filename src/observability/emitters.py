@@ -11,11 +11,11 @@ OTel spans are created by decorators in decorators.py - NOT here.
 Logs are correlated to spans via trace_id/span_id extracted from OTel span context.
 """
 
-import contextlib
-from datetime import UTC, datetime
+import time
+import traceback
 from typing import Any
 
-from .config import get_console_output, get_handler, is_initialized
+from .config import get_config, get_console_output, get_dispatcher, get_handler, has_log_sinks
 from .context import ObservabilityContext
 from .schema import D, F, LogRecord, M
 from .serializers import safe_serialize
@@ -45,52 +45,106 @@ def emit_log(
         metrics: Optional metrics dict
         tags: Optional tags list
     """
-    if not is_initialized():
+    # Nothing to do before initialization, or if every sink discards records
+    if not has_log_sinks():
         return
 
-    # Parse component info from event
-    parts = event.split(".")
-    component_type = parts[0] if parts else "unknown"
+    # Serialize data for logging (no redaction - log everything as-is)
+    _emit_serialized(level, event, ctx, safe_serialize(data), metrics, tags)
+
+
+def _emit_serialized(
+    level: str,
+    event: str,
+    ctx: ObservabilityContext,
+    data: dict[str, Any],
+    metrics: dict[str, Any] | None = None,
+    tags: list[str] | None = None,
+    timestamp: int | None = None,
+) -> None:
+    """Build and deliver a log record from already-serialized data.
+
+    Same as emit_log, minus the initialization check and safe_serialize
+    pass - for payloads that were snapshotted before being queued.
+
+    Args:
+        timestamp: When the event happened, in ns since the epoch. Deferred
+            callers pass the time captured before queueing; defaults to now.
+    """
+    # Parse component info from event ("tool.input" -> "tool")
+    component_type = event.partition(".")[0] or "unknown"
 
     # Get component name from data or context
     component_name = (
-        data.get(f"{component_type}_name")
-        or data.get("component_name")
-        or (ctx.component_stack[-1] if ctx.component_stack else "unknown")
+        data.get(f"{component_type}_name") or data.get("component_name") or ctx.current_component
     )
 
-    # Serialize data for logging (no redaction - log everything as-is)
-    data = safe_serialize(data)
+    # trace_id/span_id come from the OTel span - resolve all three in one
+    # lookup rather than once per property
+    trace_id, span_id, parent_span_id = ctx.resolve_ids()
 
-    # Create LogRecord - trace_id/span_id come from OTel span via context properties
+    # Create LogRecord
     record = LogRecord(
-        timestamp=datetime.now(UTC),
-        trace_id=ctx.trace_id,  # From OTel span context
-        span_id=ctx.span_id,  # From OTel span context
-        parent_span_id=ctx.parent_span_id,  # From OTel span context
+        timestamp=timestamp or time.time_ns(),
+        trace_id=trace_id,
+        span_id=span_id,
+        parent_span_id=parent_span_id,
         session_id=ctx.session_id,  # Business metadata (we manage)
         request_id=ctx.request_id,  # Business metadata (we manage)
         level=level,
         event=event,
         component_type=component_type,
         component_name=component_name,
-        triggered_by=ctx.triggered_by,  # Derived from component_stack
+        triggered_by=ctx.triggered_by,  # Derived from parent context
         data=data,
         metrics=metrics or {},
         tags=tags or [],
     )
 
+    # With background emission, delivery happens on the dispatcher thread.
+    # Records built while draining are delivered inline to keep their order.
+    dispatcher = get_dispatcher()
+    if dispatcher is not None and not dispatcher.in_drain():
+        dispatcher.submit(_deliver, record)
+    else:
+        _deliver(record)
+
+
+def _deliver(record: LogRecord) -> None:
+    """Send a record to the handler and console output."""
     # Send to handler (OTel backend → Elasticsearch)
     handler = get_handler()
     if handler:
-        with contextlib.suppress(Exception):
+        try:  # noqa: SIM105 - hot path, suppress() is slower
             handler.send_log(record)
+        except Exception:
+            pass
 
     # Also write to console if enabled (for dev)
     console = get_console_output()
     if console:
-        with contextlib.suppress(Exception):
+        try:  # noqa: SIM105 - hot path, suppress() is slower
             console.write_log(record)
+        except Exception:
+            pass
+
+
+def _emit_drop_summary(dropped: int, dropped_total: int) -> None:
+    """Log that the background dispatcher dropped pending logs.
+
+    Installed as the dispatcher's on_drop callback, so it runs on the drain
+    thread (rate limited there) and is delivered inline.
+
+    Args:
+        dropped: Logs dropped since the previous summary
+        dropped_total: Logs dropped since the dispatcher started
+    """
+    emit_log(
+        "WARNING",
+        "observability.dropped",
+        ObservabilityContext(component_name="observability"),
+        {"dropped": dropped, "dropped_total": dropped_total},
+    )
 
 
 def emit_debug(
@@ -137,62 +191,161 @@ def emit_error(
     emit_log("ERROR", event, ctx, data, metrics, tags)
 
 
+def snapshot_input(input_data: dict[str, Any]) -> Any:
+    """Serialize component inputs once, when the component is called.
+
+    The component may mutate its arguments, so the start and error logs
+    both use this snapshot instead of the live objects. Pass it on with
+    serialized=True.
+
+    Args:
+        input_data: Input data for the component
+
+    Returns:
+        Serialized input data, or input_data as-is if there are no sinks.
+    """
+    if not has_log_sinks():
+        return input_data
+    return safe_serialize(input_data)
+
+
 def emit_component_start(
-    component_type: str, component_name: str, ctx: ObservabilityContext, input_data: dict[str, Any]
+    component_type: str,
+    component_name: str,
+    ctx: ObservabilityContext,
+    input_data: Any,
+    serialized: bool = False,
 ) -> None:
     """Emit component start log.
 
     OTel span is created by the decorator - this only emits the log.
+    With background emission enabled, the log is queued for the
+    dispatcher thread instead of being emitted inline.
 
     Args:
         component_type: Type of component (agent, tool, llm_client)
         component_name: Name of the component
         ctx: Observability context
         input_data: Input data for the component
+        serialized: input_data is already a snapshot from snapshot_input()
+    """
+    if not has_log_sinks():
+        return
+
+    dispatcher = get_dispatcher()
+    # Span-less contexts resolve IDs from the *current* span, so they must
+    # be emitted on the caller's thread
+    if dispatcher is not None and ctx.has_span:
+        # Inputs are snapshotted since the call may mutate them, and the
+        # record is stamped now rather than when the drain thread runs
+        dispatcher.submit(
+            _emit_component_start,
+            component_type,
+            component_name,
+            ctx,
+            input_data if serialized else safe_serialize(input_data),
+            True,
+            time.time_ns(),
+        )
+    else:
+        _emit_component_start(component_type, component_name, ctx, input_data, serialized)
+
+
+def _emit_component_start(
+    component_type: str,
+    component_name: str,
+    ctx: ObservabilityContext,
+    input_data: Any,
+    serialized: bool = False,
+    timestamp: int | None = None,
+) -> None:
+    """Build and emit the component start log.
+
+    serialized=True skips a second safe_serialize pass over a snapshot;
+    timestamp is the call time captured before the log was queued.
     """
     name_key = f"{component_type}_name"
+    data = {name_key: component_name, F.TRIGGERED_BY: ctx.triggered_by, D.INPUT: input_data}
 
-    emit_log(
-        level="DEBUG",
-        event=f"{component_type}.input",
-        ctx=ctx,
-        data={name_key: component_name, F.TRIGGERED_BY: ctx.triggered_by, D.INPUT: input_data},
-    )
+    if serialized:
+        _emit_serialized("DEBUG", f"{component_type}.input", ctx, data, timestamp=timestamp)
+    else:
+        emit_log("DEBUG", f"{component_type}.input", ctx, data)
 
 
 def emit_component_end(
     component_type: str,
     component_name: str,
     ctx: ObservabilityContext,
-    output_data: dict[str, Any],
+    output_data: Any,
     duration_ms: float,
     metrics: dict[str, Any] | None = None,
 ) -> None:
     """Emit component completion log.
 
     OTel span status is set by the decorator - this only emits the log.
+    With background emission enabled, the log is queued for the
+    dispatcher thread instead of being emitted inline.
 
     Args:
         component_type: Type of component
         component_name: Name of the component
         ctx: Observability context
-        output_data: Output data from the component
+        output_data: Output data from the component (raw - serialized by emit_log)
         duration_ms: Execution duration in milliseconds
         metrics: Additional metrics
     """
+    if not has_log_sinks():
+        return
+
+    dispatcher = get_dispatcher()
+    if dispatcher is not None and ctx.has_span:
+        # Snapshot the output and the time now - the caller owns the output
+        # and may mutate it before the dispatcher thread gets to it
+        dispatcher.submit(
+            _emit_component_end,
+            component_type,
+            component_name,
+            ctx,
+            safe_serialize(output_data),
+            duration_ms,
+            metrics,
+            True,
+            time.time_ns(),
+        )
+    else:
+        _emit_component_end(component_type, component_name, ctx, output_data, duration_ms, metrics)
+
+
+def _emit_component_end(
+    component_type: str,
+    component_name: str,
+    ctx: ObservabilityContext,
+    output_data: Any,
+    duration_ms: float,
+    metrics: dict[str, Any] | None,
+    serialized: bool = False,
+    timestamp: int | None = None,
+) -> None:
+    """Build and emit the component completion log.
+
+    serialized=True skips a second safe_serialize pass over a snapshot;
+    timestamp is the completion time captured before the log was queued.
+    """
     name_key = f"{component_type}_name"
 
     all_metrics = {M.DURATION_MS: duration_ms}
     if metrics:
         all_metrics.update(metrics)
 
-    emit_log(
-        level="DEBUG",
-        event=f"{component_type}.output",
-        ctx=ctx,
-        data={name_key: component_name, D.OUTPUT: output_data, D.DURATION_MS: duration_ms},
-        metrics=all_metrics,
-    )
+    data = {name_key: component_name, D.OUTPUT: output_data, D.DURATION_MS: duration_ms}
+
+    if serialized:
+        _emit_serialized(
+            "DEBUG", f"{component_type}.output", ctx, data, all_metrics, timestamp=timestamp
+        )
+    else:
+        emit_log("DEBUG", f"{component_type}.output", ctx, data, all_metrics)
 
 
 def emit_component_error(
@@ -200,22 +353,26 @@ def emit_component_error(
     component_name: str,
     ctx: ObservabilityContext,
     exception: Exception,
-    input_data: dict[str, Any],
+    input_data: Any,
     duration_ms: float,
+    serialized: bool = False,
 ) -> None:
     """Emit component error log.
 
     OTel span error status is set by the decorator - this only emits the log.
+    The stack trace is left out when capture_stack_trace is disabled.
 
     Args:
         component_type: Type of component
         component_name: Name of the component
         ctx: Observability context
         exception: The exception that occurred
-        input_data: Input data when error occurred
+        input_data: Input data the component was called with
         duration_ms: Duration until error in milliseconds
+        serialized: input_data is already a snapshot from snapshot_input()
     """
-    import traceback
+    if not has_log_sinks():
+        return
 
     name_key = f"{component_type}_name"
 
@@ -224,15 +381,19 @@ def emit_component_error(
         F.TRIGGERED_BY: ctx.triggered_by,
         D.ERROR_TYPE: type(exception).__name__,
         D.ERROR_MESSAGE: str(exception),
-        D.STACK_TRACE: traceback.format_exc(),
-        D.INPUT: input_data,
+        D.INPUT: input_data if serialized else safe_serialize(input_data),
         D.DURATION_MS: duration_ms,
     }
 
-    emit_log(
-        level="ERROR",
-        event=f"{component_type}.error",
-        ctx=ctx,
-        data=error_data,
+    config = get_config()
+    if config is None or config.capture_stack_trace:
+        error_data[D.STACK_TRACE] = "".join(traceback.format_exception(exception))
+
+    # Every other value is already a str or float
+    _emit_serialized(
+        "ERROR",
+        f"{component_type}.error",
+        ctx,
+        error_data,
         metrics={M.DURATION_MS: duration_ms},
     )
@@ -13,12 +13,47 @@ of the code unaware of the specific backend.
 """
 
 import contextlib
+import os
 import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any
 
 from .schema import LogRecord, TraceEvent
+from .serializers import to_json
+
+# OTLP attribute value types passed through without JSON encoding
+_SCALAR_TUPLE = (str, int, float, bool)
+_SCALAR_TYPES = frozenset(_SCALAR_TUPLE)
+
+# BatchLogRecordProcessor settings when neither config nor env sets them:
+# field -> (environment variable, SDK default)
+_SDK_BATCH_DEFAULTS = {
+    "batch_size": ("OTEL_BLRP_MAX_EXPORT_BATCH_SIZE", 512),
+    "flush_interval_ms": ("OTEL_BLRP_SCHEDULE_DELAY", 5000),
+    "max_queue_size": ("OTEL_BLRP_MAX_QUEUE_SIZE", 2048),
+}
+
+
+def _effective_batch_setting(name: str, value: int | None) -> int:
+    """Get the value BatchLogRecordProcessor will use for a batch setting.
+
+    Args:
+        name: OTelConfig field name (a key of _SDK_BATCH_DEFAULTS)
+        value: Configured value, None if unset
+
+    Returns:
+        The configured value, else the environment variable, else the SDK
+        default (the SDK also falls back to it for a non-integer variable).
+    """
+    if value is not None:
+        return value
+    env_var, default = _SDK_BATCH_DEFAULTS[name]
+    try:
+        return int(os.environ.get(env_var, default))
+    except ValueError:
+        return default
 
 
 class LogHandler(ABC):
@@ -54,6 +89,17 @@ class LogHandler(ABC):
         """Flush any buffered data."""
         pass
 
+    def is_active(self) -> bool:
+        """Check whether records sent to this handler go anywhere.
+
+        Checked once by initialize_observability(): when neither the handler
+        nor the console is active, emitters skip building records entirely.
+
+        Returns:
+            True unless the handler is known to discard everything.
+        """
+        return True
+
     @abstractmethod
     def close(self) -> None:
         """Close the handler and release resources."""
@@ -62,13 +108,42 @@ class LogHandler(ABC):
 
 @dataclass
 class OTelConfig:
-    """Configuration for OTel gRPC handler."""
+    """Configuration for OTel gRPC handler.
+
+    The batching fields configure the SDK's BatchLogRecordProcessor: records
+    are exported in batches of up to batch_size every flush_interval_ms, and
+    once max_queue_size records are waiting, new ones are dropped. Fields left
+    as None keep the SDK's own defaults (512 records, 5000 ms, 2048 records,
+    30000 ms, or the OTEL_BLRP_* environment variables).
+
+    Raises:
+        ValueError: If the effective batch_size, flush_interval_ms or
+            max_queue_size (config, else environment, else SDK default) is
+            not positive, or batch_size exceeds max_queue_size - the SDK
+            would reject it and leave log export disabled.
+    """
 
     endpoint: str = "localhost:4317"
     insecure: bool = True
     service_name: str = "crawler-agent"
-    batch_size: int = 100
-    flush_interval_ms: int = 1000
+    batch_size: int | None = None
+    flush_interval_ms: int | None = None
+    max_queue_size: int | None = None
+    export_timeout_ms: int | None = None
+
+    def __post_init__(self) -> None:
+        effective = {
+            name: _effective_batch_setting(name, getattr(self, name))
+            for name in _SDK_BATCH_DEFAULTS
+        }
+        for name, value in effective.items():
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+        batch_size, max_queue_size = effective["batch_size"], effective["max_queue_size"]
+        if batch_size > max_queue_size:
+            raise ValueError(
+                f"batch_size ({batch_size}) must not exceed max_queue_size ({max_queue_size})"
+            )
 
 
 class OTelGrpcHandler(LogHandler):
@@ -88,6 +163,10 @@ class OTelGrpcHandler(LogHandler):
         self._lock = threading.Lock()
         self._initialized = False
         self._logger_provider: Any = None  # Type: LoggerProvider when initialized
+        self._logger: Any = None  # Type: Logger, resolved once from the provider
+        # level -> (SeverityNumber, severity text), built once the SDK is imported
+        self._severity_map: dict[str, tuple[Any, str]] = {}
+        self._default_severity: tuple[Any, str] = (None, "INFO")
         self._initialize()
 
     def _initialize(self) -> None:
@@ -96,7 +175,7 @@ class OTelGrpcHandler(LogHandler):
         Note: Trace exporter is initialized in tracer.py, not here.
         """
         try:
-            from opentelemetry._logs import set_logger_provider
+            from opentelemetry._logs import SeverityNumber, set_logger_provider
             from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
             from opentelemetry.sdk._logs import LoggerProvider
             from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
@@ -109,8 +188,27 @@ class OTelGrpcHandler(LogHandler):
                 endpoint=self.config.endpoint, insecure=self.config.insecure
             )
             self._logger_provider = LoggerProvider(resource=resource)
-            self._logger_provider.add_log_record_processor(BatchLogRecordProcessor(log_exporter))
+            # The processor does the batching - size it from our config
+            self._logger_provider.add_log_record_processor(
+                BatchLogRecordProcessor(
+                    log_exporter,
+                    schedule_delay_millis=self.config.flush_interval_ms,
+                    max_export_batch_size=self.config.batch_size,
+                    max_queue_size=self.config.max_queue_size,
+                    export_timeout_millis=self.config.export_timeout_ms,
+                )
+            )
             set_logger_provider(self._logger_provider)
+            self._logger = self._logger_provider.get_logger(self.config.service_name)
+
+            # Map our level to OTel severity
+            self._severity_map = {
+                "DEBUG": (SeverityNumber.DEBUG, "DEBUG"),
+                "INFO": (SeverityNumber.INFO, "INFO"),
+                "WARNING": (SeverityNumber.WARN, "WARN"),
+                "ERROR": (SeverityNumber.ERROR, "ERROR"),
+            }
+            self._default_severity = self._severity_map["INFO"]
 
             self._initialized = True
         except ImportError as e:
@@ -130,20 +228,8 @@ class OTelGrpcHandler(LogHandler):
             return
 
         try:
-            import json
-            import time
-
-            from opentelemetry._logs import SeverityNumber
-
-            # Map our level to OTel severity
-            severity_map = {
-                "DEBUG": (SeverityNumber.DEBUG, "DEBUG"),
-                "INFO": (SeverityNumber.INFO, "INFO"),
-                "WARNING": (SeverityNumber.WARN, "WARN"),
-                "ERROR": (SeverityNumber.ERROR, "ERROR"),
-            }
-            severity_number, severity_text = severity_map.get(
-                record.level, (SeverityNumber.INFO, "INFO")
+            severity_number, severity_text = self._severity_map.get(
+                record.level, self._default_severity
             )
 
             # Build attributes dict with all our structured data
@@ -164,11 +250,16 @@ class OTelGrpcHandler(LogHandler):
             if record.data:
                 for key, value in record.data.items():
                     attr_key = f"data.{key}"
-                    if isinstance(value, (str, int, float, bool)):
+                    # Exact type lookup first; isinstance only for subclasses
+                    if type(value) in _SCALAR_TYPES:
                         attributes[attr_key] = value
-                    elif value is not None:
+                    elif value is None:
+                        continue
+                    elif isinstance(value, _SCALAR_TUPLE):
+                        attributes[attr_key] = value
+                    else:
                         try:
-                            json_str = json.dumps(value, default=str)
+                            json_str = to_json(value)
                             if len(json_str) > 65000:
                                 json_str = json_str[:65000] + "...[TRUNCATED]"
                             attributes[attr_key] = json_str
@@ -185,8 +276,8 @@ class OTelGrpcHandler(LogHandler):
                         attributes[attr_key] = str(value)
 
             # Emit using Logger.emit() with keyword arguments
-            self._logger_provider.get_logger(self.config.service_name).emit(
-                timestamp=int(record.timestamp.timestamp() * 1e9),
+            self._logger.emit(
+                timestamp=record.timestamp,
                 observed_timestamp=time.time_ns(),
                 severity_number=severity_number,
                 severity_text=severity_text,
@@ -209,6 +300,10 @@ class OTelGrpcHandler(LogHandler):
         # Spans are created by decorators, not here
         pass
 
+    def is_active(self) -> bool:
+        """Active only if the OTel log exporter was set up."""
+        return self._initialized
+
     def flush(self) -> None:
         """Force flush log exporter."""
         if self._initialized and self._logger_provider:
@@ -241,31 +336,55 @@ class NullHandler(LogHandler):
     def close(self) -> None:
         pass
 
+    def is_active(self) -> bool:
+        """Inactive unless a subclass overrides send_log."""
+        return type(self).send_log is not NullHandler.send_log
+
 
 class CompositeHandler(LogHandler):
     """Combines multiple handlers into one.
 
-    Sends to all handlers. Errors in one don't affect others.
+    Sends to all handlers. Errors in one don't affect others; they are
+    counted in ``errors`` instead of propagating.
+
+    Whether any handler is active is read once by initialize_observability().
+    Treat the handler list as fixed after that, or re-initialize after
+    changing it, since emitters skip all work while no sink is active.
     """
 
     def __init__(self, handlers: list):
         self.handlers = handlers
+        self.errors = 0
+
+    # Per-record paths use try/except rather than contextlib.suppress, which
+    # costs a context manager object and two method calls per handler
 
     def send_log(self, record: LogRecord) -> None:
         for handler in self.handlers:
-            with contextlib.suppress(Exception):
+            try:
                 handler.send_log(record)
+            except Exception:
+                self.errors += 1
 
     def send_trace(self, event: TraceEvent) -> None:
         for handler in self.handlers:
-            with contextlib.suppress(Exception):
+            try:
                 handler.send_trace(event)
+            except Exception:
+                self.errors += 1
 
     def flush(self) -> None:
         for handler in self.handlers:
             with contextlib.suppress(Exception):
                 handler.flush()
 
+    def is_active(self) -> bool:
+        # Handlers without is_active() (duck-typed) count as active
+        return any(
+            getattr(handler, "is_active", None) is None or handler.is_active()
+            for handler in self.handlers
+        )
+
     def close(self) -> None:
         for handler in self.handlers:
             with contextlib.suppress(Exception):
@@ -7,8 +7,8 @@ For backend integration, see handlers.py.
 import contextlib
 import sys
 import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Any, ClassVar, TextIO
 
 from .schema import LogRecord
@@ -64,18 +64,35 @@ class ConsoleOutput(LogOutput):
         self.color = color and hasattr(self.stream, "isatty") and self.stream.isatty()
         self._lock = threading.Lock()
 
+        # Escape codes resolved once - empty strings when color is off
+        self._level_colors = self.LEVEL_COLORS if self.color else {}
+        self._reset = self.RESET if self.color else ""
+        self._dim = self.DIM if self.color else ""
+        self._bold = self.BOLD if self.color else ""
+
+        # (epoch second, "HH:MM:SS") of the last line - consecutive logs
+        # mostly share a second, so strftime runs about once per second
+        self._last_second: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, timestamp_ns: int) -> str:
+        """Format a nanosecond timestamp as HH:MM:SS.mmm (UTC)."""
+        seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+        cached_second, hms = self._last_second
+        if cached_second != seconds:
+            hms = time.strftime("%H:%M:%S", time.gmtime(seconds))
+            # Single tuple assignment - safe to race between writer threads
+            self._last_second = (seconds, hms)
+        return f"{hms}.{nanos // 1_000_000:03d}"
+
     def write_log(self, record: LogRecord) -> None:
         """Write log record to console."""
-        color = self.LEVEL_COLORS.get(record.level, "") if self.color else ""
-        reset = self.RESET if self.color else ""
-        dim = self.DIM if self.color else ""
-        bold = self.BOLD if self.color else ""
+        color = self._level_colors.get(record.level, "")
+        reset = self._reset
+        dim = self._dim
+        bold = self._bold
 
-        # Format timestamp
-        if isinstance(record.timestamp, datetime):
-            timestamp = record.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        else:
-            timestamp = str(record.timestamp)[:12]
+        # Format timestamp (UTC, millisecond precision)
+        timestamp = self._format_timestamp(record.timestamp)
 
         # Short span ID for readability
         span_short = record.span_id[-8:] if record.span_id else "--------"
@@ -110,12 +127,8 @@ class ConsoleOutput(LogOutput):
 
     def write_trace_event(self, event: dict[str, Any]) -> None:
         """Write trace event to console (simplified format)."""
-        if not self.color:
-            dim = ""
-            reset = ""
-        else:
-            dim = self.DIM
-            reset = self.RESET
+        dim = self._dim
+        reset = self._reset
 
         name = event.get("name", "unknown")
         span_id = event.get("span_id", "")[-8:]
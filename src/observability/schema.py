@@ -6,11 +6,62 @@ Level is METADATA ONLY - never used for filtering.
 Field definitions include Elasticsearch types for index template generation.
 """
 
+import time
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _datetime_to_ns(dt: datetime) -> int:
+    """Convert a datetime to nanoseconds since the epoch (naive means UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+def _timestamp_from_dict(value: Any) -> int:
+    """Convert a serialized timestamp (ISO string, datetime or ns) to ns."""
+    if isinstance(value, str):
+        return parse_timestamp_ns(value)
+    if isinstance(value, datetime):
+        return _datetime_to_ns(value)
+    if value is None:
+        return time.time_ns()
+    return value
+
+
+def format_timestamp_ns(timestamp_ns: int | datetime) -> str:
+    """Format a nanosecond epoch timestamp as an ISO 8601 UTC string.
+
+    Args:
+        timestamp_ns: Nanoseconds since the epoch (time.time_ns()). A
+            datetime is also accepted; naive datetimes are taken to be UTC.
+
+    Returns:
+        ISO 8601 timestamp with microsecond precision
+    """
+    if isinstance(timestamp_ns, datetime):
+        timestamp_ns = _datetime_to_ns(timestamp_ns)
+    return (_EPOCH + timedelta(microseconds=timestamp_ns // 1000)).isoformat()
+
+
+def parse_timestamp_ns(value: str) -> int:
+    """Parse an ISO 8601 timestamp into nanoseconds since the epoch.
+
+    Naive timestamps are taken to be UTC.
+
+    Args:
+        value: ISO 8601 string (a trailing 'Z' is accepted)
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    return _datetime_to_ns(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
 
 class ComponentType(Enum):
     """Types of observable components."""
@@ -382,7 +433,7 @@ def generate_trace_index_template(index_pattern: str = "crawler-traces*") -> dic
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class LogRecord:
     """Complete log record for unconditional emission.
 
@@ -391,9 +442,15 @@ class LogRecord:
 
     The 'data' field structure depends on event type - see class D for documentation.
     The 'metrics' field uses keys from class M.
+
+    timestamp is nanoseconds since the epoch (time.time_ns()). It is only
+    formatted as ISO 8601 when the record is serialized; to_dict() also
+    accepts a datetime here, as built by earlier versions.
+
+    Slotted: at least two records are built per traced call.
     """
 
-    timestamp: datetime
+    timestamp: int
     trace_id: str
     span_id: str
     parent_span_id: str | None
@@ -411,9 +468,7 @@ class LogRecord:
     def to_dict(self) -> dict:
         """Serialize to dict for output. Field names from F class constants."""
         return {
-            F.TIMESTAMP: self.timestamp.isoformat()
-            if isinstance(self.timestamp, datetime)
-            else self.timestamp,
+            F.TIMESTAMP: format_timestamp_ns(self.timestamp),
             F.TRACE_ID: self.trace_id,
             F.SPAN_ID: self.span_id,
             F.PARENT_SPAN_ID: self.parent_span_id,
@@ -432,14 +487,8 @@ class LogRecord:
     @classmethod
     def from_dict(cls, data: dict) -> "LogRecord":
         """Create LogRecord from dictionary. Field names from F class constants."""
-        timestamp = data.get(F.TIMESTAMP)
-        if isinstance(timestamp, str):
-            timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        elif timestamp is None:
-            timestamp = datetime.now(UTC)
-
         return cls(
-            timestamp=timestamp,
+            timestamp=_timestamp_from_dict(data.get(F.TIMESTAMP)),
             trace_id=data.get(F.TRACE_ID, ""),
             span_id=data.get(F.SPAN_ID, ""),
             parent_span_id=data.get(F.PARENT_SPAN_ID),
@@ -456,16 +505,18 @@ class LogRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TraceEvent:
     """Trace event for span creation/completion.
 
     The 'attributes' field contains span metadata - see TRACE_EVENT_FIELDS
     for the defined attribute schema.
+
+    timestamp is nanoseconds since the epoch, like LogRecord.timestamp.
     """
 
     name: str
-    timestamp: datetime
+    timestamp: int
     trace_id: str
     span_id: str
     parent_span_id: str | None
@@ -475,11 +526,21 @@ class TraceEvent:
         """Serialize to dict for output. Field names from F class constants."""
         return {
             F.NAME: self.name,
-            F.TIMESTAMP: self.timestamp.isoformat()
-            if isinstance(self.timestamp, datetime)
-            else self.timestamp,
+            F.TIMESTAMP: format_timestamp_ns(self.timestamp),
             F.TRACE_ID: self.trace_id,
             F.SPAN_ID: self.span_id,
             F.PARENT_SPAN_ID: self.parent_span_id,
             F.ATTRIBUTES: self.attributes,
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TraceEvent":
+        """Create TraceEvent from dictionary. Field names from F class constants."""
+        return cls(
+            name=data.get(F.NAME, ""),
+            timestamp=_timestamp_from_dict(data.get(F.TIMESTAMP)),
+            trace_id=data.get(F.TRACE_ID, ""),
+            span_id=data.get(F.SPAN_ID, ""),
+            parent_span_id=data.get(F.PARENT_SPAN_ID),
+            attributes=data.get(F.ATTRIBUTES, {}),
+        )
@@ -5,6 +5,7 @@ IMPORTANT: Does NOT truncate data. Full data is always captured.
 Truncation happens at query/display time, not emission time.
 """
 
+import json
 import uuid
 from dataclasses import asdict, is_dataclass
 from datetime import date, datetime
@@ -12,6 +13,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional - install the fast-json extra for faster encoding
+    orjson = None  # type: ignore[assignment]
+
 
 def safe_serialize(obj: Any, max_depth: int = 10, current_depth: int = 0) -> Any:
     """Safely serialize any object for logging.
@@ -104,6 +110,28 @@ def safe_serialize(obj: Any, max_depth: int = 10, current_depth: int = 0) -> Any
         return f"<unserializable: {type(obj).__name__}>"
 
 
+def to_json(obj: Any) -> str:
+    """Encode already-serialized data as a JSON string.
+
+    Uses orjson when it is installed (compact output, non-ASCII kept as-is).
+    Otherwise, or when orjson rejects a value such as an int wider than
+    64 bits, falls back to plain json.dumps(obj, default=str), whose output
+    keeps the stdlib's default separators and ASCII escaping.
+
+    Args:
+        obj: JSON-compatible data (typically output of safe_serialize)
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=str)
+
+
 def truncate_for_display(obj: Any, max_length: int = 1000) -> Any:
     """Truncate strings for display purposes only.
 
@@ -144,6 +172,6 @@ def extract_error_info(exception: Exception) -> dict:
         "error_type": type(exception).__name__,
         "error_message": str(exception),
         "error_module": type(exception).__module__,
-        "stack_trace": traceback.format_exc(),
+        "stack_trace": "".join(traceback.format_exception(exception)),
         "exception_args": safe_serialize(exception.args),
     }
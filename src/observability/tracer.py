@@ -15,14 +15,16 @@ Usage:
         ...
 """
 
+from typing import TYPE_CHECKING, Optional
+
 from opentelemetry import trace
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
 
 # Global tracer instance
 _tracer: trace.Tracer | None = None
-_provider: TracerProvider | None = None
+_provider: Optional["TracerProvider"] = None
 
 
 def init_tracer(
@@ -43,7 +45,11 @@ def init_tracer(
     global _tracer, _provider
 
     try:
+        # SDK is imported here, not at module level - only needed once at startup
         from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
         resource = Resource.create({SERVICE_NAME: service_name})
         _provider = TracerProvider(resource=resource)
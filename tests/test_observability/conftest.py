@@ -0,0 +1,54 @@
+"""Shared fixtures for observability tests."""
+
+import pytest
+
+from src.observability import ObservabilityConfig, initialize_observability, shutdown
+from src.observability.context import _observability_context
+from src.observability.handlers import NullHandler
+from src.observability.schema import LogRecord
+
+
+class RecordingHandler(NullHandler):
+    """Handler that keeps every record it receives."""
+
+    def __init__(self):
+        self.records = []
+
+    def send_log(self, record):
+        self.records.append(record)
+
+    def events(self) -> list[str]:
+        """Get the event names of all received records, in order."""
+        return [record.event for record in self.records]
+
+
+def make_record(**overrides) -> LogRecord:
+    """Build a minimal log record."""
+    fields = {
+        "timestamp": 1_700_000_000_000_000_000,
+        "trace_id": "",
+        "span_id": "",
+        "parent_span_id": None,
+        "session_id": None,
+        "request_id": None,
+        "level": "INFO",
+        "event": "tool.input",
+        "component_type": "tool",
+        "component_name": "my_tool",
+        "triggered_by": "direct_call",
+        "data": {},
+        "metrics": {},
+        "tags": [],
+    }
+    fields.update(overrides)
+    return LogRecord(**fields)
+
+
+@pytest.fixture
+def recording_handler():
+    """Initialize observability with a RecordingHandler (console disabled)."""
+    handler = RecordingHandler()
+    initialize_observability(handler=handler, config=ObservabilityConfig(console_enabled=False))
+    _observability_context.set(None)
+    yield handler
+    shutdown()
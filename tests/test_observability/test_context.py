@@ -1,9 +1,14 @@
 """Tests for context propagation with OTel spans."""
 
+import dataclasses
+import gc
+import weakref
+
 import pytest
 
 from src.observability import (
     ObservabilityConfig,
+    context as context_module,
     initialize_observability,
     shutdown,
 )
@@ -15,7 +20,9 @@ from src.observability.context import (
     reset_context,
     set_context,
 )
+from src.observability.emitters import emit_info
 from src.observability.handlers import NullHandler
+from src.observability.tracer import get_tracer
 
 
 @pytest.fixture(autouse=True)
@@ -58,7 +65,7 @@ class TestObservabilityContext:
         # Business metadata should be generated
         assert ctx.session_id.startswith("sess_")
         assert ctx.request_id.startswith("req_")
-        assert ctx.component_stack == ["root"]
+        assert ctx.component_stack == ("root",)
 
     def test_create_root_no_span_returns_empty_ids(self):
         """Test that root context without OTel span has empty IDs."""
@@ -76,6 +83,14 @@ class TestObservabilityContext:
 
         assert ctx.session_id == "custom_session"
 
+    def test_create_root_ids_unique(self):
+        """Test that generated session and request IDs never repeat."""
+        roots = [ObservabilityContext.create_root() for _ in range(1000)]
+
+        ids = {ctx.session_id for ctx in roots} | {ctx.request_id for ctx in roots}
+        assert len(ids) == 2000
+        assert all(len(ctx.session_id) >= len("sess_") + 16 for ctx in roots)
+
     def test_create_child_inherits_business_metadata(self):
         """Test that child inherits session and request from parent."""
         parent = ObservabilityContext.create_root()
@@ -86,7 +101,7 @@ class TestObservabilityContext:
         assert child.request_id == parent.request_id
 
         # Component stack is extended
-        assert child.component_stack == ["root", "my_component"]
+        assert child.component_stack == ("root", "my_component")
 
     def test_triggered_by(self):
         """Test triggered_by property."""
@@ -107,6 +122,40 @@ class TestObservabilityContext:
         child = root.create_child("my_tool")
         assert child.current_component == "my_tool"
 
+    def test_with_span_preserves_component_chain(self):
+        """Test that with_span keeps the component chain of the original context."""
+        child = ObservabilityContext.create_root().create_child("component1")
+        swapped = child.with_span(None)
+
+        assert swapped.component_stack == ("root", "component1")
+        assert swapped.triggered_by == "root"
+        assert swapped.start_time == child.start_time
+
+    def test_bare_context_defaults(self):
+        """Test component properties of a context with no component chain."""
+        ctx = ObservabilityContext()
+
+        assert ctx.component_stack == ()
+        assert ctx.current_component == "unknown"
+        assert ctx.triggered_by == "direct_call"
+
+    def test_component_stack_constructor(self):
+        """Test that a component_stack list is turned into a parent chain."""
+        ctx = ObservabilityContext(
+            session_id="s", request_id="r", component_stack=["root", "a", "b"]
+        )
+
+        assert ctx.component_stack == ("root", "a", "b")
+        assert ctx.current_component == "b"
+        assert ctx.triggered_by == "a"
+        assert ctx._parent.session_id == "s"
+        assert ctx.create_child("c").component_stack == ("root", "a", "b", "c")
+
+    def test_component_stack_with_component_name_rejected(self):
+        """Test that the two ways of naming the component can't be mixed."""
+        with pytest.raises(TypeError, match="component_stack"):
+            ObservabilityContext(component_name="a", component_stack=["b"])
+
     def test_to_dict(self):
         """Test serialization to dictionary."""
         ctx = ObservabilityContext.create_root()
@@ -120,6 +169,22 @@ class TestObservabilityContext:
         assert "triggered_by" in data
         assert "component_stack" in data
         assert "start_time" in data
+        assert data["component_stack"] == ["root"]
+
+    def test_start_time_iso(self):
+        """Test that the nanosecond start_time is rendered as ISO 8601 UTC."""
+        ctx = ObservabilityContext(start_time=1_700_000_000_123_456_789)
+
+        assert ctx.start_time_iso == "2023-11-14T22:13:20.123456+00:00"
+        assert ctx.to_dict()["start_time"] == ctx.start_time_iso
+
+    def test_context_is_slotted(self):
+        """Test that contexts don't carry a per-instance __dict__."""
+        ctx = ObservabilityContext.create_root()
+
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.unknown_field = "value"
 
 
 class TestContextFunctions:
@@ -135,7 +200,7 @@ class TestContextFunctions:
         assert ctx is not None
         # Business metadata should be set
         assert ctx.session_id.startswith("sess_")
-        assert ctx.component_stack == ["test_component"]
+        assert ctx.component_stack == ("test_component",)
 
     def test_set_and_reset_context(self):
         """Test setting and resetting context."""
@@ -230,6 +295,78 @@ class TestObservabilitySpan:
                 with ObservabilitySpan("level3") as ctx3:
                     assert ctx3.triggered_by == "level2"
 
+    def test_span_ids_stable_after_exit(self):
+        """Test that a context keeps its span's IDs once the span has ended."""
+        _observability_context.set(None)
+
+        with ObservabilitySpan("level1") as ctx1:
+            with ObservabilitySpan("level2") as ctx2:
+                ids = (ctx2.trace_id, ctx2.span_id, ctx2.parent_span_id)
+            outer_span_id = ctx1.span_id
+
+        assert (ctx2.trace_id, ctx2.span_id, ctx2.parent_span_id) == ids
+        assert ctx2.parent_span_id == outer_span_id
+
+    def test_context_does_not_keep_span_alive(self):
+        """Test that a context holds its span weakly."""
+        span = get_tracer().start_span("short_lived")
+        ctx = ObservabilityContext.create_root().create_child("tool", span)
+        span_id = ctx.span_id
+        span.end()
+        span_ref = weakref.ref(span)
+        del span
+        gc.collect()
+
+        assert span_ref() is None
+        assert ctx.span_id == span_id
+
+    def test_held_child_keeps_ids_after_span_ends(self):
+        """Test that a child created inside a span keeps its IDs once it ends."""
+        with ObservabilitySpan("outer") as outer:
+            held = ObservabilityContext.get_current().create_child("sub")
+            trace_id = outer.trace_id
+        gc.collect()
+
+        assert trace_id
+        assert held.trace_id == trace_id
+        assert held.span_id == outer.span_id
+
+    def test_replace_keeps_span_and_ids(self):
+        """Test that dataclasses.replace() works on a context with a span."""
+        with ObservabilitySpan("outer") as outer:
+            copy = dataclasses.replace(outer, component_name="renamed")
+
+        assert copy.component_name == "renamed"
+        assert copy.has_span
+        assert copy.span_id == outer.span_id
+
+    def test_context_without_span_follows_current_span(self):
+        """Test that a span-less context is not pinned to the first span it sees."""
+        root = ObservabilityContext.create_root()
+
+        with ObservabilitySpan("first") as first:
+            assert root.span_id == first.span_id
+        with ObservabilitySpan("second") as second:
+            assert root.span_id == second.span_id
+
+    def test_log_resolves_span_once(self, recording_handler, monkeypatch):
+        """Test that a log from a span-less context looks up the span once."""
+        lookups = []
+        get_current_span = context_module.trace.get_current_span
+
+        def counting_get_current_span(*args):
+            lookups.append(1)
+            return get_current_span(*args)
+
+        monkeypatch.setattr(context_module.trace, "get_current_span", counting_get_current_span)
+
+        with ObservabilitySpan("outer") as outer:
+            lookups.clear()
+            emit_info("tool.progress", ObservabilityContext.create_root(), {})
+
+        assert len(lookups) == 1
+        assert recording_handler.records[-1].span_id == outer.span_id
+
 
 class TestOTelSpanFormats:
     """Tests for OTel ID format compliance."""
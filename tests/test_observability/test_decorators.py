@@ -1,19 +1,35 @@
 """Tests for decorator-based instrumentation with OTel spans."""
 
 import asyncio
+import functools
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 
 from src.observability import (
     ObservabilityConfig,
+    decorators,
+    has_log_sinks,
     initialize_observability,
     shutdown,
 )
+from src.observability.context import ObservabilityContext, _observability_context
 from src.observability.decorators import (
+    _extract_llm_metrics,
+    _get_input_params,
+    _prepare_input_data,
     traced_agent,
     traced_llm_client,
     traced_tool,
 )
+from src.observability.emitters import emit_component_error
 from src.observability.handlers import NullHandler
 
 
@@ -30,6 +46,8 @@ def setup_observability():
         otel_insecure=True,
     )
     initialize_observability(handler=handler, config=config)
+    # Reset context between tests
+    _observability_context.set(None)
     yield
     shutdown()
 
@@ -86,6 +104,143 @@ class TestTracedTool:
         result = tool.execute(5)
         assert result == {"result": 10}
 
+    def test_method_uses_instance_name(self):
+        """Test that self.name overrides the decorator name for methods."""
+
+        class MyTool:
+            name = "instance_tool"
+
+            @traced_tool(name="method_tool")
+            def execute(self):
+                return ObservabilityContext.get_current().component_name
+
+        assert MyTool().execute() == "instance_tool"
+
+    def test_function_ignores_first_arg_name(self):
+        """Test that a plain function's first argument never renames the tool."""
+
+        @dataclass
+        class Task:
+            name: str
+
+        @traced_tool(name="plain_tool")
+        def run(task):
+            return ObservabilityContext.get_current().component_name
+
+        assert run(Task(name="not_a_tool")) == "plain_tool"
+
+    def test_reentrant_calls_traced_by_default(self, recording_handler):
+        """Test that a recursive call of the same tool is logged separately."""
+
+        @traced_tool(name="recursive_tool")
+        def countdown(n):
+            return countdown(n - 1) if n else {}
+
+        countdown(2)
+
+        assert recording_handler.events().count("tool.input") == 3
+
+    def test_reentrant_skip(self, recording_handler):
+        """Test that reentrant_skip folds re-entrant calls into the outer call."""
+
+        @traced_tool(name="recursive_tool", reentrant_skip=True)
+        def countdown(n):
+            return countdown(n - 1) if n else {"done": True}
+
+        assert countdown(2) == {"done": True}
+        assert recording_handler.events() == ["tool.input", "tool.output"]
+
+
+class TestUninitialized:
+    """Tests for decorated calls while observability is not initialized."""
+
+    def test_sync_call_runs_untraced(self):
+        """Test that calls bypass span and context setup before initialization."""
+        shutdown()
+
+        @traced_tool(name="idle_tool")
+        def idle_tool(x):
+            return ObservabilityContext.get_current(), x
+
+        assert idle_tool(1) == (None, 1)
+
+    @pytest.mark.asyncio
+    async def test_async_call_runs_untraced(self):
+        """Test the async bypass."""
+        shutdown()
+
+        @traced_agent(name="idle_agent")
+        async def idle_agent():
+            return ObservabilityContext.get_current()
+
+        assert await idle_agent() is None
+
+
+class TestLogSinks:
+    """Tests for skipping log work when no sink would receive it."""
+
+    def test_null_handler_without_console_has_no_sinks(self):
+        """Test that NullHandler with console disabled counts as no sink."""
+        assert not has_log_sinks()
+
+    def test_recording_handler_is_a_sink(self, recording_handler):
+        """Test that a NullHandler subclass overriding send_log is active."""
+        assert has_log_sinks()
+
+    def test_error_log_skips_traceback(self, monkeypatch):
+        """Test that no traceback is formatted for a log nobody receives."""
+        monkeypatch.setattr(
+            "traceback.format_exception", lambda *a: pytest.fail("traceback formatted")
+        )
+
+        emit_component_error(
+            "tool", "failing_tool", ObservabilityContext.create_root(), ValueError(), {}, 1.0
+        )
+
+    def test_ids_available_after_call_without_sinks(self):
+        """Test that contexts keep their IDs even though no log resolved them."""
+        captured = []
+
+        @traced_tool(name="quiet_tool")
+        def quiet_tool():
+            captured.append(ObservabilityContext.get_current())
+
+        quiet_tool()
+
+        assert len(captured[0].span_id) == 16
+
+
+class TestErrorLogs:
+    """Tests for component error log contents."""
+
+    def _raise_in_tool(self):
+        @traced_tool(name="failing_tool")
+        def failing_tool():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            failing_tool()
+
+    def test_stack_trace_included_by_default(self, recording_handler):
+        """Test that error logs carry the formatted traceback."""
+        self._raise_in_tool()
+
+        (record,) = [r for r in recording_handler.records if r.event == "tool.error"]
+        assert "ValueError: boom" in record.data["stack_trace"]
+
+    def test_stack_trace_can_be_disabled(self, recording_handler):
+        """Test that capture_stack_trace=False leaves the traceback out."""
+        initialize_observability(
+            handler=recording_handler,
+            config=ObservabilityConfig(console_enabled=False, capture_stack_trace=False),
+        )
+
+        self._raise_in_tool()
+
+        (record,) = [r for r in recording_handler.records if r.event == "tool.error"]
+        assert "stack_trace" not in record.data
+        assert record.data["error_message"] == "boom"
+
 
 class TestTracedAgent:
     """Tests for @traced_agent decorator."""
@@ -112,6 +267,19 @@ class TestTracedAgent:
         result = await run_async_agent("async task")
         assert result == {"success": True, "task": "async task"}
 
+    @pytest.mark.asyncio
+    async def test_async_partial_is_awaited(self):
+        """Test that a partial of a coroutine function gets the async wrapper."""
+
+        async def run_async_agent(prefix: str, task: str) -> dict:
+            await asyncio.sleep(0)
+            return {"task": f"{prefix}{task}"}
+
+        wrapped = traced_agent(name="partial_agent")(functools.partial(run_async_agent, "p:"))
+
+        assert inspect.iscoroutinefunction(wrapped)
+        assert await wrapped("task") == {"task": "p:task"}
+
 
 class TestTracedLLMClient:
     """Tests for @traced_llm_client decorator."""
@@ -311,6 +479,57 @@ class TestOTelSpanIds:
         int(trace_id, 16)
 
 
+class TestSpanAttributes:
+    """Tests for attributes set on decorator spans."""
+
+    @pytest.fixture
+    def exporter(self):
+        exporter = InMemorySpanExporter()
+        trace.get_tracer_provider().add_span_processor(SimpleSpanProcessor(exporter))
+        yield exporter
+        exporter.shutdown()
+
+    def test_component_and_metric_attributes(self, exporter):
+        """Test that component metadata and scalar LLM metrics land on the span."""
+
+        @traced_llm_client(provider="openai")
+        def chat(messages: list, model: str = "gpt-4") -> dict:
+            return {"tokens_input": 10, "tool_calls": [{"id": "1"}]}
+
+        chat([], model="gpt-4o")
+
+        attributes = exporter.get_finished_spans()[-1].attributes
+        assert attributes["component.type"] == "llm"
+        assert attributes["component.name"] == "openai"
+        assert attributes["session.id"].startswith("sess_")
+        assert attributes["llm.tokens.input"] == 10
+        assert attributes["llm.model"] == "gpt-4o"
+        assert "duration_ms" in attributes
+        assert "llm.response.tool_calls" not in attributes
+
+    def test_sampled_out_span_still_logs(self, recording_handler, monkeypatch):
+        """Test that non-recording spans skip span updates but keep the logs."""
+        tracer = TracerProvider(sampler=ALWAYS_OFF).get_tracer("sampled_out")
+        monkeypatch.setattr(decorators, "get_tracer", lambda: tracer)
+
+        @traced_tool(name="sampled_tool")
+        def sampled_tool(fail):
+            if fail:
+                raise ValueError("boom")
+            return {}
+
+        sampled_tool(False)
+        with pytest.raises(ValueError):
+            sampled_tool(True)
+
+        assert recording_handler.events() == [
+            "tool.input",
+            "tool.output",
+            "tool.input",
+            "tool.error",
+        ]
+
+
 class TestBusinessMetadata:
     """Tests for business metadata preservation."""
 
@@ -343,6 +562,25 @@ class TestBusinessMetadata:
         # Has expected format
         assert session_ids[0].startswith("sess_")
 
+    def test_root_call_is_direct_call(self):
+        """Test that a call with no active context starts a fresh root context."""
+        captured = []
+
+        @traced_agent(name="root_agent")
+        def root_agent():
+            from src.observability.context import ObservabilityContext
+
+            captured.append(ObservabilityContext.get_current())
+            return {}
+
+        root_agent()
+
+        ctx = captured[0]
+        assert ctx.component_stack == ("root_agent",)
+        assert ctx.triggered_by == "direct_call"
+        assert ctx.session_id.startswith("sess_")
+        assert ctx.request_id.startswith("req_")
+
     def test_triggered_by_tracking(self):
         """Test that triggered_by tracks parent component."""
         triggered_by_values = []
@@ -370,3 +608,181 @@ class TestBusinessMetadata:
         # Tool was triggered by agent
         assert len(triggered_by_values) == 2
         assert triggered_by_values[1] == "parent_agent"
+
+
+class TestInputData:
+    """Tests for input data captured by decorators."""
+
+    def test_signature_inspected_once_at_decoration(self, monkeypatch):
+        """Test that the signature is not re-inspected on every call."""
+        calls = []
+        original = inspect.signature
+
+        def counting_signature(func):
+            calls.append(func)
+            return original(func)
+
+        monkeypatch.setattr(inspect, "signature", counting_signature)
+
+        @traced_tool(name="counted_tool")
+        def counted(a, b):
+            return {}
+
+        counted(1, 2)
+        counted(3, 4)
+
+        assert len(calls) == 1
+
+    def test_named_args_skip_self(self):
+        """Test that positional args are named and self is skipped."""
+
+        class MyTool:
+            def execute(self, query, limit=10):
+                pass
+
+        params = _get_input_params(MyTool.execute)
+        data = _prepare_input_data((MyTool(), "term", 5), {"extra": True}, params)
+
+        assert data == {"args": {"query": "term", "limit": 5}, "kwargs": {"extra": True}}
+
+    def test_extra_positional_args_are_numbered(self):
+        """Test that *args beyond named parameters get positional names."""
+
+        def func(a, *rest):
+            pass
+
+        data = _prepare_input_data((1, 2, 3), {}, _get_input_params(func))
+
+        assert data["args"] == {"a": 1, "rest": 2, "arg_2": 3}
+
+    def test_uninspectable_signature_falls_back(self):
+        """Test fallback serialization when the signature is unavailable."""
+        data = _prepare_input_data(("self", 1, 2), {"k": "v"}, None)
+
+        assert data == {"args": [1, 2], "kwargs": {"k": "v"}}
+
+    def test_input_is_serialized_for_log(self, recording_handler):
+        """Test that raw input values reach the input log serialized."""
+
+        @traced_tool(name="path_tool")
+        def path_tool(path, items=()):
+            return {}
+
+        path_tool(Path("/tmp/in"), items=(1, 2))
+
+        record = recording_handler.records[0]
+        assert record.event == "tool.input"
+        assert record.data["input"] == {"args": {"path": "/tmp/in"}, "kwargs": {"items": [1, 2]}}
+
+    def test_error_log_shows_inputs_at_call_time(self, recording_handler):
+        """Test that inputs mutated before raising are logged as they were passed."""
+
+        @traced_tool(name="mutating_tool")
+        def mutating_tool(items):
+            items.append("added")
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            mutating_tool(["orig"])
+
+        start, error = recording_handler.records
+        assert error.event == "tool.error"
+        assert error.data["input"]["args"] == {"items": ["orig"]}
+        assert start.data["input"] == error.data["input"]
+
+
+class TestOutputData:
+    """Tests for output data captured by decorators."""
+
+    def test_output_is_serialized_once_for_log(self, recording_handler):
+        """Test that non-JSON results reach the output log serialized."""
+
+        @dataclass
+        class Result:
+            path: Path
+            items: tuple
+
+        @traced_tool(name="result_tool")
+        def result_tool():
+            return Result(path=Path("/tmp/out"), items=(1, 2))
+
+        result_tool()
+
+        output = recording_handler.records[-1]
+        assert output.event == "tool.output"
+        assert output.data["output"] == {"path": "/tmp/out", "items": [1, 2]}
+
+    def test_llm_output_keeps_selected_fields(self, recording_handler):
+        """Test that LLM output logs only carry the simplified fields."""
+
+        @traced_llm_client(provider="openai")
+        def chat(messages: list) -> dict:
+            return {"content": "Hi", "finish_reason": "stop", "usage": {"total_tokens": 3}}
+
+        chat([{"role": "user", "content": "Hi"}])
+
+        output = recording_handler.records[-1]
+        assert output.data["output"] == {"content": "Hi", "finish_reason": "stop"}
+
+
+class TestExtractLLMMetrics:
+    """Tests for LLM metric extraction."""
+
+    def test_wrapper_dict_format(self):
+        """Test metrics from LLMClient.chat's dict format."""
+        result = {
+            "model": "gpt-4o",
+            "tokens_input": 10,
+            "tokens_output": 5,
+            "tokens_total": 15,
+            "estimated_cost_usd": 0.01,
+            "finish_reason": "stop",
+            "tool_called": False,
+            "tool_calls": [],
+        }
+
+        metrics = _extract_llm_metrics(result, {"temperature": 0.2})
+
+        assert metrics == {
+            "llm.tokens.input": 10,
+            "llm.tokens.output": 5,
+            "llm.tokens.total": 15,
+            "llm.cost.total": 0.01,
+            "llm.response.finish_reason": "stop",
+            "llm.response.tool_called": False,
+            "llm.model": "gpt-4o",
+            "llm.temperature": 0.2,
+        }
+
+    def test_usage_dict_and_kwargs_model(self):
+        """Test metrics from a raw usage dict with the model taken from kwargs."""
+        result = {"usage": {"prompt_tokens": 3, "completion_tokens": 4, "total_tokens": None}}
+
+        metrics = _extract_llm_metrics(result, {"model": "m", "max_tokens": 100})
+
+        assert metrics == {
+            "llm.tokens.input": 3,
+            "llm.tokens.output": 4,
+            "llm.model": "m",
+            "llm.max_tokens": 100,
+        }
+
+    def test_response_object_with_usage(self):
+        """Test metrics from an OpenAI-style response object."""
+
+        class Usage:
+            prompt_tokens = 7
+            completion_tokens = 8
+            total_tokens = 15
+
+        class Response:
+            usage = Usage()
+
+        metrics = _extract_llm_metrics(Response(), {})
+
+        assert metrics == {
+            "llm.tokens.input": 7,
+            "llm.tokens.output": 8,
+            "llm.tokens.total": 15,
+            "llm.model": "unknown",
+        }
@@ -0,0 +1,243 @@
+"""Tests for background dispatch of log emission."""
+
+import time
+
+import pytest
+
+from src.observability import (
+    ObservabilityConfig,
+    emitters,
+    get_dispatcher,
+    initialize_observability,
+    shutdown,
+)
+from src.observability.context import ObservabilityContext, _observability_context
+from src.observability.decorators import traced_tool
+from src.observability.dispatcher import BackgroundDispatcher
+from src.observability.emitters import emit_info
+from src.observability.handlers import NullHandler
+from src.observability.serializers import safe_serialize
+
+from .conftest import RecordingHandler
+
+
+class TestBackgroundDispatcher:
+    """Tests for the BackgroundDispatcher ring buffer."""
+
+    def test_flush_runs_calls_in_order(self):
+        """Test that queued calls run in submission order."""
+        dispatcher = BackgroundDispatcher(interval=60)
+        calls = []
+
+        for i in range(5):
+            dispatcher.submit(calls.append, i)
+        dispatcher.flush()
+
+        assert calls == [0, 1, 2, 3, 4]
+        dispatcher.close()
+
+    def test_full_buffer_drops_oldest(self):
+        """Test that a full buffer discards the oldest pending calls."""
+        dispatcher = BackgroundDispatcher(capacity=3, interval=60)
+        calls = []
+
+        # Hold the drain lock so the background thread can't drain early
+        with dispatcher._drain_lock:
+            for i in range(5):
+                dispatcher.submit(calls.append, i)
+        dispatcher.flush()
+
+        assert calls == [2, 3, 4]
+        assert dispatcher.dropped == 2
+        dispatcher.close()
+
+    def test_errors_do_not_stop_draining(self):
+        """Test that a failing call doesn't prevent later calls."""
+        dispatcher = BackgroundDispatcher(interval=60)
+        calls = []
+
+        def failing():
+            raise RuntimeError("boom")
+
+        dispatcher.submit(failing)
+        dispatcher.submit(calls.append, "after")
+        dispatcher.flush()
+
+        assert calls == ["after"]
+        dispatcher.close()
+
+    def test_close_drains_pending_calls(self):
+        """Test that close() emits everything still queued."""
+        dispatcher = BackgroundDispatcher(interval=60)
+        calls = []
+
+        dispatcher.submit(calls.append, "pending")
+        dispatcher.close()
+
+        assert calls == ["pending"]
+
+    def test_drops_reported_rate_limited(self):
+        """Test that on_drop gets new and total drops, at most once per interval."""
+        reports = []
+        dispatcher = BackgroundDispatcher(
+            capacity=1,
+            interval=60,
+            on_drop=lambda new, total: reports.append((new, total)),
+            drop_report_interval=60,
+        )
+
+        for _ in range(2):
+            with dispatcher._drain_lock:
+                for i in range(3):
+                    dispatcher.submit(int, i)
+            dispatcher.flush()
+
+        # The second round falls inside the interval; close() reports it anyway
+        assert reports == [(2, 2)]
+        dispatcher.close()
+        assert reports == [(2, 2), (2, 4)]
+
+
+class TestBackgroundEmission:
+    """Tests for component logs emitted through the dispatcher."""
+
+    @pytest.fixture
+    def handler(self):
+        handler = RecordingHandler()
+        config = ObservabilityConfig(console_enabled=False, background_emit=True)
+        initialize_observability(handler=handler, config=config)
+        _observability_context.set(None)
+        yield handler
+        shutdown()
+
+    def test_component_logs_queued(self, handler):
+        """Test that queued start/end logs keep their order and span IDs."""
+        captured = []
+
+        @traced_tool(name="bg_tool")
+        def bg_tool():
+            captured.append(ObservabilityContext.get_current())
+            return {"ok": True}
+
+        bg_tool()
+        get_dispatcher().flush()
+
+        assert handler.events() == ["tool.input", "tool.output"]
+        assert all(record.span_id == captured[0].span_id for record in handler.records)
+
+    def test_queued_logs_stamped_at_call_time(self, handler):
+        """Test that queued start/end logs keep call order with nested logs."""
+
+        @traced_tool(name="bg_tool")
+        def bg_tool():
+            emit_info("tool.progress", ObservabilityContext.get_current(), {})
+            return {}
+
+        # Hold the drain lock so start/end are built well after the call
+        with get_dispatcher()._drain_lock:
+            bg_tool()
+            time.sleep(0.01)
+        get_dispatcher().flush()
+
+        stamps = {record.event: record.timestamp for record in handler.records}
+        assert stamps["tool.input"] <= stamps["tool.progress"] <= stamps["tool.output"]
+
+    def test_input_snapshotted_before_queueing(self, handler):
+        """Test that mutating an argument after the call starts doesn't leak into the log."""
+
+        @traced_tool(name="bg_tool")
+        def bg_tool(messages):
+            messages.append("added during call")
+            return {}
+
+        bg_tool(["original"])
+        get_dispatcher().flush()
+
+        assert handler.records[0].data["input"]["args"] == {"messages": ["original"]}
+
+    def test_snapshots_not_serialized_twice(self, handler, monkeypatch):
+        """Test that queued start/end payloads skip the second serialize pass."""
+        calls = []
+
+        def counting_serialize(obj):
+            calls.append(obj)
+            return safe_serialize(obj)
+
+        monkeypatch.setattr(emitters, "safe_serialize", counting_serialize)
+
+        @traced_tool(name="bg_tool")
+        def bg_tool(value):
+            return {"value": value}
+
+        bg_tool(1)
+        get_dispatcher().flush()
+
+        assert len(calls) == 2
+        assert handler.records[-1].data["output"] == {"value": 1}
+
+    def test_error_log_delivered_in_order(self, handler):
+        """Test that error logs are queued behind the start log of the same call."""
+
+        @traced_tool(name="bg_tool")
+        def bg_tool():
+            raise ValueError("boom")
+
+        # Hold the drain lock so nothing is delivered before the assertion
+        with get_dispatcher()._drain_lock:
+            with pytest.raises(ValueError):
+                bg_tool()
+            assert handler.records == []
+
+        get_dispatcher().flush()
+        assert handler.events() == ["tool.input", "tool.error"]
+
+    def test_direct_logs_queued(self, handler):
+        """Test that logs emitted outside decorators are delivered by the dispatcher."""
+        with get_dispatcher()._drain_lock:
+            emit_info("custom.event", ObservabilityContext.create_root(), {"key": "value"})
+            assert handler.records == []
+
+        get_dispatcher().flush()
+        assert handler.events() == ["custom.event"]
+
+    def test_shutdown_drains_queue(self, handler):
+        """Test that shutdown emits queued logs before closing the handler."""
+
+        @traced_tool(name="bg_tool")
+        def bg_tool():
+            return {}
+
+        bg_tool()
+        shutdown()
+
+        assert handler.events() == ["tool.input", "tool.output"]
+
+    def test_serialized_emit_keeps_supplied_timestamp(self, handler):
+        """Test that deferred callers can stamp a record with the event time."""
+        ctx = ObservabilityContext.create_root()
+        emitters._emit_serialized("INFO", "custom.event", ctx, {}, timestamp=123)
+        emitters._emit_serialized("INFO", "custom.event", ctx, {})
+        get_dispatcher().flush()
+
+        first, second = handler.records
+        assert first.timestamp == 123
+        assert second.timestamp > 123
+
+    def test_drops_logged_as_warning(self, handler):
+        """Test that dropped logs are summarized in a log of their own."""
+        dispatcher = get_dispatcher()
+        with dispatcher._drain_lock:
+            dispatcher.dropped = 3
+        dispatcher.flush()
+
+        (record,) = handler.records
+        assert (record.level, record.event) == ("WARNING", "observability.dropped")
+        assert record.data == {"dropped": 3, "dropped_total": 3}
+
+    def test_dispatcher_disabled_by_default(self):
+        """Test that component logs are emitted inline unless enabled."""
+        initialize_observability(NullHandler(), ObservabilityConfig(console_enabled=False))
+        try:
+            assert get_dispatcher() is None
+        finally:
+            shutdown()
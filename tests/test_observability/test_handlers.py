@@ -0,0 +1,214 @@
+"""Tests for observability backend handlers."""
+
+import pytest
+
+from src.observability import (
+    ObservabilityConfig,
+    has_log_sinks,
+    initialize_observability,
+    shutdown,
+)
+from src.observability.handlers import CompositeHandler, NullHandler, OTelConfig, OTelGrpcHandler
+
+from .conftest import RecordingHandler, make_record
+
+
+class DuckHandler:
+    """Handler implementing only the methods the emitters call."""
+
+    def send_log(self, record):
+        pass
+
+    def send_trace(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def otel_handler():
+    """OTel handler pointed at an unreachable collector (export is lazy)."""
+    handler = OTelGrpcHandler(OTelConfig(endpoint="localhost:1", batch_size=10))
+    yield handler
+    handler.close()
+
+
+@pytest.fixture
+def blrp_env(monkeypatch):
+    """Clear the OTEL_BLRP_* variables so the SDK defaults apply."""
+    for var in (
+        "OTEL_BLRP_MAX_EXPORT_BATCH_SIZE",
+        "OTEL_BLRP_SCHEDULE_DELAY",
+        "OTEL_BLRP_MAX_QUEUE_SIZE",
+    ):
+        monkeypatch.delenv(var, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def processor_kwargs(monkeypatch):
+    """Record the keyword arguments the handler passes to the batch processor."""
+    from opentelemetry.sdk._logs import export
+
+    captured = {}
+
+    class RecordingProcessor(export.BatchLogRecordProcessor):
+        def __init__(self, exporter, **kwargs):
+            captured.update(kwargs)
+            super().__init__(exporter, **kwargs)
+
+    monkeypatch.setattr(export, "BatchLogRecordProcessor", RecordingProcessor)
+    return captured
+
+
+class TestOTelGrpcHandler:
+    """Tests for OTelGrpcHandler."""
+
+    def test_logger_resolved_once(self, otel_handler, monkeypatch):
+        """Test that send_log emits through the logger cached at init."""
+        emitted = []
+        monkeypatch.setattr(
+            otel_handler._logger_provider,
+            "get_logger",
+            lambda *a, **k: pytest.fail("logger looked up per record"),
+        )
+        monkeypatch.setattr(otel_handler._logger, "emit", lambda **kw: emitted.append(kw))
+
+        otel_handler.send_log(make_record())
+        otel_handler.send_log(make_record(level="ERROR"))
+
+        assert [kw["severity_text"] for kw in emitted] == ["INFO", "ERROR"]
+        assert emitted[0]["timestamp"] == 1_700_000_000_000_000_000
+
+    def test_unknown_level_maps_to_info(self, otel_handler, monkeypatch):
+        """Test that levels outside the map are sent as INFO."""
+        from opentelemetry._logs import SeverityNumber
+
+        emitted = []
+        monkeypatch.setattr(otel_handler._logger, "emit", lambda **kw: emitted.append(kw))
+
+        otel_handler.send_log(make_record(level="WARNING"))
+        otel_handler.send_log(make_record(level="TRACE"))
+
+        assert [(kw["severity_number"], kw["severity_text"]) for kw in emitted] == [
+            (SeverityNumber.WARN, "WARN"),
+            (SeverityNumber.INFO, "INFO"),
+        ]
+
+    def test_data_attribute_encoding(self, otel_handler, monkeypatch):
+        """Test scalar pass-through, JSON for containers, and skipped Nones."""
+
+        class Label(str):
+            pass
+
+        emitted = []
+        monkeypatch.setattr(otel_handler._logger, "emit", lambda **kw: emitted.append(kw))
+
+        data = {"count": 3, "flag": True, "label": Label("x"), "items": [1], "missing": None}
+        otel_handler.send_log(make_record(data=data))
+
+        attributes = emitted[0]["attributes"]
+        assert attributes["data.count"] == 3
+        assert attributes["data.flag"] is True
+        assert attributes["data.label"] == "x"
+        assert attributes["data.items"] == "[1]"
+        assert "data.missing" not in attributes
+
+    def test_batch_settings_default_to_sdk(self, processor_kwargs):
+        """Test that unset batch fields leave the SDK defaults in place."""
+        OTelGrpcHandler(OTelConfig(endpoint="localhost:1")).close()
+
+        assert processor_kwargs["max_export_batch_size"] is None
+        assert processor_kwargs["schedule_delay_millis"] is None
+
+    def test_batch_settings_passed_when_set(self, processor_kwargs):
+        """Test that explicit batch fields configure the processor."""
+        config = OTelConfig(endpoint="localhost:1", batch_size=10, flush_interval_ms=200)
+        OTelGrpcHandler(config).close()
+
+        assert processor_kwargs["max_export_batch_size"] == 10
+        assert processor_kwargs["schedule_delay_millis"] == 200
+
+    def test_queue_settings_passed_when_set(self, processor_kwargs):
+        """Test that queue size and export timeout reach the processor."""
+        config = OTelConfig(
+            endpoint="localhost:1", batch_size=10, max_queue_size=50, export_timeout_ms=500
+        )
+        OTelGrpcHandler(config).close()
+
+        assert processor_kwargs["max_queue_size"] == 50
+        assert processor_kwargs["export_timeout_millis"] == 500
+
+    @pytest.mark.parametrize(
+        ("batch_size", "max_queue_size"),
+        [(100, 10), (4096, None), (None, 100)],
+    )
+    def test_batch_larger_than_queue_rejected(self, batch_size, max_queue_size, blrp_env):
+        """Test that a config the SDK would reject fails loudly up front."""
+        with pytest.raises(ValueError, match="max_queue_size"):
+            OTelConfig(batch_size=batch_size, max_queue_size=max_queue_size)
+
+    def test_batch_checked_against_env_queue_size(self, blrp_env):
+        """Test that environment variables count for settings left unset."""
+        blrp_env.setenv("OTEL_BLRP_MAX_QUEUE_SIZE", "8192")
+        OTelConfig(batch_size=4096)
+
+        blrp_env.setenv("OTEL_BLRP_MAX_EXPORT_BATCH_SIZE", "1000")
+        with pytest.raises(ValueError, match="max_queue_size"):
+            OTelConfig(max_queue_size=500)
+
+    @pytest.mark.parametrize("field", ["batch_size", "flush_interval_ms", "max_queue_size"])
+    def test_non_positive_setting_rejected(self, field, blrp_env):
+        """Test that 0 is rejected rather than treated as unset."""
+        with pytest.raises(ValueError, match=field):
+            OTelConfig(**{field: 0})
+
+
+class TestIsActive:
+    """Tests for LogHandler.is_active()."""
+
+    def test_null_handler_inactive(self):
+        assert not NullHandler().is_active()
+
+    def test_null_handler_subclass_with_send_log_active(self):
+        assert RecordingHandler().is_active()
+
+    def test_composite_active_if_any_child_is(self):
+        assert not CompositeHandler([NullHandler()]).is_active()
+        assert CompositeHandler([NullHandler(), RecordingHandler()]).is_active()
+
+    def test_duck_typed_handler_counts_as_active(self):
+        """Test that handlers without is_active() are treated as sinks."""
+        assert CompositeHandler([NullHandler(), DuckHandler()]).is_active()
+
+    def test_duck_typed_handler_at_init(self):
+        """Test that initialization accepts a handler without is_active()."""
+        initialize_observability(DuckHandler(), ObservabilityConfig(console_enabled=False))
+        try:
+            assert has_log_sinks()
+        finally:
+            shutdown()
+
+
+class TestCompositeHandler:
+    """Tests for CompositeHandler."""
+
+    def test_failing_handler_is_counted_and_isolated(self):
+        """Test that one failing handler neither blocks the others nor raises."""
+
+        class FailingHandler(NullHandler):
+            def send_log(self, record):
+                raise RuntimeError("backend down")
+
+        recording = RecordingHandler()
+        composite = CompositeHandler([FailingHandler(), recording])
+
+        composite.send_log(make_record())
+        composite.send_log(make_record())
+
+        assert len(recording.records) == 2
+        assert composite.errors == 2
@@ -0,0 +1,44 @@
+"""Tests for local log outputs."""
+
+import io
+
+from src.observability.outputs import ConsoleOutput
+
+from .conftest import make_record
+
+
+class TtyStream(io.StringIO):
+    """StringIO that claims to be a terminal, so colors are enabled."""
+
+    def isatty(self):
+        return True
+
+
+class TestConsoleOutput:
+    """Tests for ConsoleOutput."""
+
+    def test_timestamp_follows_second_changes(self):
+        """Test that the cached HH:MM:SS prefix is refreshed each second."""
+        stream = io.StringIO()
+        console = ConsoleOutput(stream=stream)
+
+        console.write_log(make_record(timestamp=1_700_000_000_123_000_000))
+        console.write_log(make_record(timestamp=1_700_000_000_456_000_000))
+        console.write_log(make_record(timestamp=1_700_000_001_007_000_000))
+
+        times = [line.split(" ", 1)[0] for line in stream.getvalue().splitlines()]
+        assert times == ["22:13:20.123", "22:13:20.456", "22:13:21.007"]
+
+    def test_plain_stream_has_no_escape_codes(self):
+        """Test that color is off for non-terminal streams."""
+        stream = io.StringIO()
+        ConsoleOutput(stream=stream, color=True).write_log(make_record(level="ERROR"))
+
+        assert "\033[" not in stream.getvalue()
+
+    def test_terminal_stream_colored_by_level(self):
+        """Test that level colors are applied when writing to a terminal."""
+        stream = TtyStream()
+        ConsoleOutput(stream=stream).write_log(make_record(level="ERROR"))
+
+        assert f"{ConsoleOutput.LEVEL_COLORS['ERROR']}ERROR" in stream.getvalue()
@@ -0,0 +1,84 @@
+"""Tests for record schema and timestamp conversion."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from src.observability.schema import (
+    F,
+    LogRecord,
+    TraceEvent,
+    format_timestamp_ns,
+    parse_timestamp_ns,
+)
+
+from .conftest import make_record
+
+# 2023-11-14T22:13:20.123456 UTC
+TS_NS = 1_700_000_000_123_456_000
+TS_ISO = "2023-11-14T22:13:20.123456+00:00"
+
+
+class TestTimestampConversion:
+    """Tests for format_timestamp_ns/parse_timestamp_ns."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2023-11-14T22:13:20.123456",
+            "2023-11-14T22:13:20.123456Z",
+            "2023-11-14T22:13:20.123456+00:00",
+            "2023-11-15T00:13:20.123456+02:00",
+        ],
+    )
+    def test_parse_naive_z_and_offset(self, value):
+        """Test that naive, 'Z' and offset timestamps name the same instant."""
+        assert parse_timestamp_ns(value) == TS_NS
+
+    def test_format_truncates_sub_microsecond(self):
+        """Test that nanoseconds below a microsecond are dropped, not rounded."""
+        assert format_timestamp_ns(TS_NS + 999) == TS_ISO
+
+    def test_format_parse_round_trip(self):
+        assert parse_timestamp_ns(format_timestamp_ns(TS_NS)) == TS_NS
+
+    def test_format_accepts_datetime(self):
+        """Test that aware and naive (UTC) datetimes are formatted like ns."""
+        aware = datetime(2023, 11, 15, 0, 13, 20, 123456, tzinfo=timezone(timedelta(hours=2)))
+        naive = datetime(2023, 11, 14, 22, 13, 20, 123456)
+
+        assert format_timestamp_ns(aware) == TS_ISO
+        assert format_timestamp_ns(naive) == TS_ISO
+
+
+class TestRecordRoundTrip:
+    """Tests for LogRecord/TraceEvent to_dict/from_dict."""
+
+    def test_log_record_round_trip(self):
+        record = make_record(timestamp=TS_NS, data={"k": "v"}, tags=["t"])
+
+        assert LogRecord.from_dict(record.to_dict()) == record
+
+    def test_trace_event_round_trip(self):
+        event = TraceEvent(
+            name="tool.run",
+            timestamp=TS_NS,
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            parent_span_id=None,
+            attributes={"k": 1},
+        )
+
+        assert TraceEvent.from_dict(event.to_dict()) == event
+
+    def test_datetime_timestamp_serialized(self):
+        """Test that a record built with a datetime still serializes."""
+        record = make_record(timestamp=datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=UTC))
+
+        assert record.to_dict()[F.TIMESTAMP] == TS_ISO
+
+    def test_from_dict_accepts_datetime(self):
+        data = make_record(timestamp=TS_NS).to_dict()
+        data[F.TIMESTAMP] = datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=UTC)
+
+        assert LogRecord.from_dict(data).timestamp == TS_NS
@@ -1,14 +1,19 @@
 """Tests for serialization utilities."""
 
+import json
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from enum import Enum
 from pathlib import Path
 
+import pytest
+
+from src.observability import serializers
 from src.observability.serializers import (
     extract_error_info,
     safe_serialize,
+    to_json,
     truncate_for_display,
 )
 
@@ -145,6 +150,40 @@ class TestSafeSerialize:
         assert "<unserializable:" in result
 
 
+class TestToJson:
+    """Tests for to_json function."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        """Run each test with orjson (if installed) and with the stdlib encoder."""
+        if request.param == "stdlib":
+            monkeypatch.setattr(serializers, "orjson", None)
+        elif serializers.orjson is None:
+            pytest.skip("orjson not installed")
+
+    def test_orjson_output_compact(self):
+        """Test that orjson output is compact and keeps non-ASCII text."""
+        if serializers.orjson is None:
+            pytest.skip("orjson not installed")
+        assert to_json({"a": [1, 2], "b": "ü"}) == '{"a":[1,2],"b":"ü"}'
+
+    def test_stdlib_output_matches_json_dumps(self, monkeypatch):
+        """Test that the fallback is exactly json.dumps(obj, default=str)."""
+        monkeypatch.setattr(serializers, "orjson", None)
+        data = {"a": [1, 2], "b": "ü", "c": object}
+
+        assert to_json(data) == json.dumps(data, default=str)
+        assert to_json({"a": [1, 2], "b": "ü"}) == '{"a": [1, 2], "b": "\\u00fc"}'
+
+    def test_non_string_keys(self, backend):
+        """Test that non-string keys are encoded as strings."""
+        assert json.loads(to_json({1: "x"})) == {"1": "x"}
+
+    def test_big_int(self, backend):
+        """Test ints wider than 64 bits are encoded."""
+        assert to_json(2**70) == str(2**70)
+
+
 class TestTruncateForDisplay:
     """Tests for truncate_for_display function."""
 
@@ -200,3 +239,15 @@ class TestExtractErrorInfo:
 
         assert "stack_trace" in info
         assert "Exception: test" in info["stack_trace"]
+
+    def test_stack_trace_outside_except_block(self):
+        """Test that the trace comes from the exception, not the active one."""
+        try:
+            raise ValueError("caught earlier")
+        except ValueError as e:
+            caught = e
+
+        info = extract_error_info(caught)
+
+        assert "ValueError: caught earlier" in info["stack_trace"]
+        assert "test_stack_trace_outside_except_block" in info["stack_trace"]